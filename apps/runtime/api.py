@@ -1,17 +1,90 @@
-from fastapi import FastAPI
-from pydantic import BaseModel
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from uuid import uuid4
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel, ConfigDict
 from typing import List, Dict, Optional
-from mumbl_orchestration.flows_text import text_lane_flow
-from mumbl_orchestration.flows_audio import audio_lane_flow
-from mumbl_orchestration.flows_curator import curator_flow
 
-app = FastAPI(title="Mumbl Runtime Admin API", version="0.1.0")
+try:
+    import orjson  # noqa: F401 - ORJSONResponse needs it at render time
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
+
+# Flows run off the event loop; callers poll /jobs/{job_id} for the result.
+FLOW_WORKERS = int(os.getenv("MUMBL_FLOW_WORKERS", "4"))
+_executor = ThreadPoolExecutor(max_workers=FLOW_WORKERS, thread_name_prefix="flow")
+_jobs: Dict[str, asyncio.Future] = {}
+# Finished jobs stay pollable for JOB_RESULT_TTL_S, and at most JOB_RESULTS_MAX
+# of them are kept; running jobs are never evicted.
+JOB_RESULT_TTL_S = int(os.getenv("MUMBL_JOB_RESULT_TTL_S", "3600"))
+JOB_RESULTS_MAX = 1024
+_finished_jobs: "OrderedDict[str, float]" = OrderedDict()  # job_id -> finished_at, oldest first
+
+def _evict_finished_jobs():
+    expired_before = time.monotonic() - JOB_RESULT_TTL_S
+    while _finished_jobs:
+        job_id, finished_at = next(iter(_finished_jobs.items()))
+        if finished_at > expired_before and len(_finished_jobs) <= JOB_RESULTS_MAX:
+            break
+        _finished_jobs.popitem(last=False)
+        _jobs.pop(job_id, None)
+
+def _job_finished(job_id: str):
+    _finished_jobs[job_id] = time.monotonic()
+    _evict_finished_jobs()
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    _executor.shutdown(wait=False, cancel_futures=True)
+
+app = FastAPI(title="Mumbl Runtime Admin API", version="0.1.0", default_response_class=DefaultResponse,
+              lifespan=_lifespan)
+
+# Flow modules pull in Prefect, so they are imported on first use (in a worker
+# thread) rather than at startup; /health answers without them.
+@lru_cache(maxsize=None)
+def _text_flow():
+    from mumbl_orchestration.flows_text import text_lane_flow
+    return text_lane_flow
+
+@lru_cache(maxsize=None)
+def _audio_flow():
+    from mumbl_orchestration.flows_audio import audio_lane_flow
+    return audio_lane_flow
+
+@lru_cache(maxsize=None)
+def _curator_flow():
+    from mumbl_orchestration.flows_curator import curator_flow
+    return curator_flow
+
+def _run_flow(load_flow, man: dict) -> dict:
+    return load_flow()(man)
+
+def _submit(load_flow, man: dict) -> dict:
+    _evict_finished_jobs()
+    job_id = uuid4().hex
+    fut = asyncio.get_running_loop().run_in_executor(_executor, _run_flow, load_flow, man)
+    fut.add_done_callback(lambda _: _job_finished(job_id))
+    _jobs[job_id] = fut
+    return {"job_id": job_id}
 
 class BatchInput(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     uri: str
     doc_id: Optional[str] = None
 
 class FlowRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     batch_id: str
     lane: str
     language: str
@@ -19,47 +92,88 @@ class FlowRequest(BaseModel):
     inputs: List[BatchInput]
 
 @app.get("/health")
-def health():
+async def health():
     return {"ok": True}
 
 @app.post("/flows/text")
-def launch_text(req: FlowRequest):
-    man = {
-        "batch_id": req.batch_id,
-        "lane": "text",
-        "language": req.language,
-        "dialect": req.dialect,
-        "inputs": [i.dict() for i in req.inputs],
-    }
-    return text_lane_flow(man)
+async def launch_text(req: FlowRequest):
+    man = req.model_dump()
+    man["lane"] = "text"
+    return _submit(_text_flow, man)
 
 @app.post("/flows/audio")
-def launch_audio(req: FlowRequest):
-    man = {
-        "batch_id": req.batch_id,
-        "lane": "audio",
-        "language": req.language,
-        "dialect": req.dialect,
-        "inputs": [i.dict() for i in req.inputs],
-    }
-    return audio_lane_flow(man)
+async def launch_audio(req: FlowRequest):
+    man = req.model_dump()
+    man["lane"] = "audio"
+    return _submit(_audio_flow, man)
 
 @app.post("/flows/curator")
-def launch_curator(req: FlowRequest):
-    man = {
-        "batch_id": req.batch_id,
-        "lane": "curator",
-        "language": req.language,
-        "dialect": req.dialect,
-        "inputs": [i.dict() for i in req.inputs],
-    }
-    return curator_flow(man)
+async def launch_curator(req: FlowRequest):
+    man = req.model_dump()
+    man["lane"] = "curator"
+    return _submit(_curator_flow, man)
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    fut = _jobs.get(job_id)
+    if fut is None:
+        raise HTTPException(status_code=404, detail=f"unknown job {job_id}")
+    if not fut.done():
+        return {"job_id": job_id, "status": "running"}
+    exc = fut.exception()
+    if exc is not None:
+        return {"job_id": job_id, "status": "failed", "error": str(exc)}
+    return {"job_id": job_id, "status": "succeeded", "result": fut.result()}
 
 class PreflightResponse(BaseModel):
     hours_estimated: float
     storage_gib_estimated: float
 
+# Raw download footprint used for storage estimates
+STORAGE_GIB_PER_HOUR = 0.8
+PREFLIGHT_CACHE_TTL_S = 300
+PREFLIGHT_CACHE_SIZE = 1024
+PREFLIGHT_PROBE_TIMEOUT_S = float(os.getenv("MUMBL_PREFLIGHT_TIMEOUT_S", "60"))
+_preflight_cache: "OrderedDict[str, tuple]" = OrderedDict()  # url -> (expires_at, duration_s)
+
+async def _probe_duration_s(url: str) -> float:
+    now = time.monotonic()
+    hit = _preflight_cache.get(url)
+    if hit is not None and hit[0] > now:
+        _preflight_cache.move_to_end(url)
+        return hit[1]
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "yt-dlp", "--flat-playlist", "-J", "--", url,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail="yt-dlp is not installed")
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), PREFLIGHT_PROBE_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=f"yt-dlp timed out after {PREFLIGHT_PROBE_TIMEOUT_S}s")
+    finally:
+        # Timed out, or the client went away and the request was cancelled
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    if proc.returncode != 0:
+        raise HTTPException(status_code=502, detail=f"yt-dlp failed: {err.decode(errors='replace').strip()}")
+    meta = json.loads(out)
+    # Playlists list their videos under "entries"; flat entries may lack a duration
+    entries = meta.get("entries")
+    if entries is not None:
+        duration = sum((e or {}).get("duration") or 0 for e in entries)
+    else:
+        duration = meta.get("duration") or 0
+    _preflight_cache[url] = (now + PREFLIGHT_CACHE_TTL_S, float(duration))
+    _preflight_cache.move_to_end(url)
+    if len(_preflight_cache) > PREFLIGHT_CACHE_SIZE:
+        _preflight_cache.popitem(last=False)
+    return float(duration)
+
 @app.post("/preflight/youtube", response_model=PreflightResponse)
-def preflight_youtube(url: str):
-    # TODO: probe metadata; stubbed for now
-    return PreflightResponse(hours_estimated=1.0, storage_gib_estimated=0.8)
+async def preflight_youtube(url: str):
+    hours = await _probe_duration_s(url) / 3600.0
+    return PreflightResponse(hours_estimated=hours, storage_gib_estimated=hours * STORAGE_GIB_PER_HOUR)
@@ -2,11 +2,48 @@
 Database configuration settings for the Mumbl Language Processing System.
 """
 import os
+import threading
+import warnings
 from configparser import ConfigParser
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+@lru_cache(maxsize=8)
+def config(filename='database.toml', section='postgresql'):
+    """
+    Load database configuration from the specified TOML file.
+
+    The file is parsed once per (filename, section); the cached result is a
+    read-only mapping. Legacy INI files are still read, with a deprecation
+    warning.
+    """
+    if filename.endswith('.ini'):
+        warnings.warn(
+            f'{filename}: INI database configs are deprecated, migrate to database.toml',
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return _config_from_ini(filename, section)
+
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # Python < 3.11
+        import tomli as tomllib
+
+    with open(filename, 'rb') as f:
+        data = tomllib.load(f)
+
+    if section not in data:
+        raise Exception(f'Section {section} not found in the {filename} file')
+
+    return MappingProxyType(dict(data[section]))
 
 
-def config(filename='database.ini', section='postgresql'):
-    """Load database configuration from the specified INI file."""
+def _config_from_ini(filename, section):
+    """Load a section of a legacy INI database config."""
     # Create a parser
     parser = ConfigParser()
     # Read config file
@@ -21,52 +58,101 @@ def config(filename='database.ini', section='postgresql'):
     else:
         raise Exception(f'Section {section} not found in the {filename} file')
 
-    return db
+    return MappingProxyType(db)
+
+
+class DatabaseConfig(NamedTuple):
+    """PostgreSQL connection parameters."""
+    host: str
+    database: str
+    user: str
+    password: str
+    port: str
 
 
-# Default database configuration
-DATABASE_CONFIG = {
-    'host': os.getenv('DB_HOST', 'localhost'),
-    'database': os.getenv('DB_NAME', 'mumbl_language'),
-    'user': os.getenv('DB_USER', 'mumbl_user'),
-    'password': os.getenv('DB_PASSWORD', 'mumbl_password'),
-    'port': os.getenv('DB_PORT', '5432')
-}
+# Default database configuration, resolved from the environment once at import
+DATABASE_CONFIG = DatabaseConfig(
+    host=os.getenv('DB_HOST', 'localhost'),
+    database=os.getenv('DB_NAME', 'mumbl_language'),
+    user=os.getenv('DB_USER', 'mumbl_user'),
+    password=os.getenv('DB_PASSWORD', 'mumbl_password'),
+    port=os.getenv('DB_PORT', '5432'),
+)
+
+
+CONNECTION_STRING = (
+    f"postgresql://{DATABASE_CONFIG.user}:{DATABASE_CONFIG.password}"
+    f"@{DATABASE_CONFIG.host}:{DATABASE_CONFIG.port}/{DATABASE_CONFIG.database}"
+)
+CONNECTION_STRING_BYTES = CONNECTION_STRING.encode('utf-8')
 
 
 def get_connection_string():
     """Return a formatted connection string for SQLAlchemy or direct psycopg2 use."""
-    config = DATABASE_CONFIG
-    return f"postgresql://{config['user']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
+    return CONNECTION_STRING
 
 
 def get_connection_dict():
     """Return connection parameters as a dictionary."""
-    return DATABASE_CONFIG
+    return DATABASE_CONFIG._asdict()
+
+
+# Shared connection pools, keyed by connection parameters
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_config=None, minconn=1, maxconn=8):
+    """
+    Return the shared connection pool for the given parameters, creating it on first use.
+
+    Args:
+        db_config (dict): Connection parameters (defaults to DATABASE_CONFIG)
+        minconn (int): Connections opened when the pool is created
+        maxconn (int): Upper bound on connections held by the pool
+
+    Returns:
+        ThreadedConnectionPool: Pool to borrow connections from with getconn()/putconn()
+    """
+    params = db_config or get_connection_dict()
+    key = tuple(sorted(params.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            from psycopg2.pool import ThreadedConnectionPool
+            pool = _pools[key] = ThreadedConnectionPool(minconn, maxconn, **params)
+    return pool
+
+
+def close_pools():
+    """Close every connection held by the shared pools."""
+    with _pools_lock:
+        while _pools:
+            _pools.popitem()[1].closeall()
 
 
-# Sample database.ini file content (create this file in your project root)
+# Sample database.toml file content (create this file in your project root)
 SAMPLE_CONFIG_FILE = """
 [postgresql]
-host=localhost
-database=mumbl_language
-user=mumbl_user
-password=mumbl_password
-port=5432
+host = "localhost"
+database = "mumbl_language"
+user = "mumbl_user"
+password = "mumbl_password"
+port = 5432
 
 [postgresql_test]
-host=localhost
-database=mumbl_language_test
-user=mumbl_user
-password=mumbl_password
-port=5432
+host = "localhost"
+database = "mumbl_language_test"
+user = "mumbl_user"
+password = "mumbl_password"
+port = 5432
 """
+SAMPLE_CONFIG_BYTES = SAMPLE_CONFIG_FILE.strip().encode('utf-8')
 
 
-def create_sample_config(filepath='database.ini'):
+def create_sample_config(filepath='database.toml'):
     """Create a sample database configuration file."""
-    with open(filepath, 'w') as configfile:
-        configfile.write(SAMPLE_CONFIG_FILE.strip())
+    Path(filepath).write_bytes(SAMPLE_CONFIG_BYTES)
     print(f"Sample configuration file created at {filepath}")
 
 
@@ -0,0 +1,5 @@
+-- Partial index over unprocessed phonetics entries, for databases created
+-- before it was added to schema.sql. CONCURRENTLY avoids locking writes to
+-- the table while the index builds; it cannot run inside a transaction block.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_phonetics_unprocessed ON phonetics(phonetic_id)
+    WHERE pronunciation_variant IS NULL OR notes IS NULL;
@@ -91,6 +91,9 @@ CREATE TABLE phonetics (
 -- Create indexes for phonetics lookups
 CREATE INDEX idx_phonetics_word_id ON phonetics(word_id);
 CREATE INDEX idx_phonetics_dialect_id ON phonetics(dialect_id);
+-- Partial index over entries the phonetics agent has not processed yet
+CREATE INDEX idx_phonetics_unprocessed ON phonetics(phonetic_id)
+    WHERE pronunciation_variant IS NULL OR notes IS NULL;
 
 -- Grammar rule types enum
 CREATE TYPE grammar_rule_type AS ENUM ('syntax', 'morphology', 'phonology', 'semantics', 'pragmatics');
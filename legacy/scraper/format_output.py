@@ -7,6 +7,7 @@ into a more readable markdown format.
 """
 
 import argparse
+import io
 import json
 import re
 import sys
@@ -14,6 +15,45 @@ from datetime import datetime
 from pathlib import Path
 
 
+# Suffix appended to scraper output compressed with zstd
+COMPRESSED_SUFFIX = '.zst'
+
+
+def output_stem(input_file):
+    """
+    Get the base name of a scraper output file without its .json or .json.zst suffix.
+    
+    Args:
+        input_file (str): Path to the scraper output file
+        
+    Returns:
+        str: Base filename without directory or extensions
+    """
+    name = Path(input_file).name
+    if name.endswith(COMPRESSED_SUFFIX):
+        name = name[:-len(COMPRESSED_SUFFIX)]
+    return Path(name).stem
+
+
+def load_json_file(input_file):
+    """
+    Load a scraper JSON file, decompressing it first if it is zstd-compressed.
+    
+    Args:
+        input_file (str): Path to the .json or .json.zst file
+        
+    Returns:
+        list: The scraped word entries
+    """
+    if str(input_file).endswith(COMPRESSED_SUFFIX):
+        import zstandard
+        with open(input_file, 'rb') as f, zstandard.ZstdDecompressor().stream_reader(f) as reader:
+            return json.load(io.TextIOWrapper(reader, encoding='utf-8'))
+    
+    with open(input_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def format_word_data(word_data):
     """
     Format a single word's data into a readable markdown format.
@@ -102,7 +142,7 @@ def format_json_file(input_file, output_file=None, print_output=False):
     Format a JSON file from the Wiktionary scraper to a more readable markdown format.
     
     Args:
-        input_file (str): Path to the input JSON file
+        input_file (str): Path to the input JSON file (optionally zstd-compressed)
         output_file (str, optional): Path to the output markdown file. If None, constructs a path
                                     based on the input file name.
         print_output (bool): Whether to print the formatted output to the console
@@ -111,34 +151,31 @@ def format_json_file(input_file, output_file=None, print_output=False):
         str: Path to the output file
     """
     # Load the JSON data
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json_file(input_file)
     
     # Determine output file path
     if output_file is None:
         input_path = Path(input_file)
         output_dir = input_path.parent / "formatted"
         output_dir.mkdir(parents=True, exist_ok=True)
-        output_file = output_dir / f"{input_path.stem}_formatted.md"
+        output_file = output_dir / f"{output_stem(input_path)}_formatted.md"
     
     # Extract language from first word if available
     language = "unknown"
     if data and isinstance(data, list) and len(data) > 0:
         language = data[0].get('language', 'unknown')
     
-    # Format each word
+    # Format each word, leaving out pages the scraper marked as errors
     formatted_words = []
     for word_data in data:
-        formatted_words.append(format_word_data(word_data))
+        if 'error' not in word_data:
+            formatted_words.append(format_word_data(word_data))
     
     # Write to output file
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write(f"# Wiktionary Data - {language.upper()}\n\n")
         f.write(f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-        
-        for formatted_word in formatted_words:
-            f.write(formatted_word)
-            f.write("\n\n")
+        f.writelines(formatted_word + "\n\n" for formatted_word in formatted_words)
     
     print(f"Formatted output saved to {output_file}")
     
@@ -7,29 +7,118 @@ providing a one-stop solution for generating nicely formatted Wiktionary data.
 
 Usage:
   python scrape_and_format.py --language en --word-list word_lists/test_words.txt --limit 10 [--print]
+  python scrape_and_format.py --batch jobs.json [--workers N]
 
 Options:
   --language LANG       Language code to scrape (default: en)
   --word-list FILE      File containing list of words to scrape
   --single-word WORD    Single word to scrape instead of using a word list
+  --batch FILE          JSON array of jobs ({"language", "word_list" | "single_word", "limit", "output"})
+                        run in parallel worker processes
+  --workers N           Worker processes for --batch (default: CPU count)
   --limit N             Maximum number of words to scrape (default: no limit)
   --output DIR          Directory to save output (default: scraped_data)
   --print               Print formatted output to console
+  --compress            Compress the scraped JSON with zstd (.json.zst)
 """
 
 import os
 import sys
-import argparse
-import subprocess
 import json
-from pathlib import Path
-from datetime import datetime
+import logging
+import argparse
+from multiprocessing import Pool
 
 # Ensure we can import from the scraper directory
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import formatter
-from format_output import format_json_file
+# Import scraper and formatter
+from wiktionary_scraper import run_scrape
+from format_output import format_json_file, output_stem
+from scraper_config import setup_logging
+
+
+def scrape_and_format(language='en', word_list=None, single_word=None, limit=None,
+                      output='scraped_data', print_output=False, compress=False):
+    """
+    Scrape a set of words and format the resulting JSON file.
+    
+    Args:
+        language (str): Language code to scrape
+        word_list (str): File containing list of words to scrape
+        single_word (str): Single word to scrape instead of a word list
+        limit (int): Maximum number of words to scrape
+        output (str): Directory to save output
+        print_output (bool): Whether to print formatted output to console
+        compress (bool): Whether to compress the scraped JSON with zstd
+    
+    Returns:
+        int: Exit code (0 on success)
+    """
+    # Run the scraper in-process
+    output_file = run_scrape(
+        language=language,
+        word_list=word_list,
+        single_word=single_word,
+        limit=limit,
+        output=output,
+        compress=compress
+    )
+    
+    if not output_file or not os.path.exists(output_file):
+        print("Scraper did not produce an output file. Aborting.", file=sys.stderr)
+        return 1
+    
+    print(f"Scraper completed successfully. Output saved to: {output_file}")
+    
+    # Format the output
+    print(f"Formatting output file: {output_file}")
+    
+    # Generate output filename for formatted data
+    formatted_dir = os.path.join(output, 'formatted')
+    os.makedirs(formatted_dir, exist_ok=True)
+    
+    # Extract the base filename without path or extension
+    formatted_output = os.path.join(formatted_dir, f"{output_stem(output_file)}_formatted.md")
+    
+    # Format the JSON file
+    format_json_file(output_file, formatted_output, print_output=print_output)
+    
+    print(f"Formatting completed. Formatted output saved to: {formatted_output}")
+    return 0
+
+
+def _run_job(job):
+    """Run one --batch job; executed in a worker process. Failures are logged, not raised."""
+    try:
+        return scrape_and_format(**job)
+    except Exception:
+        # An exception here would abort pool.map and discard the other jobs
+        logging.exception(f"Batch job failed: {job}")
+        return 1
+
+
+def run_batch(jobs, workers=None):
+    """
+    Run several scrape-and-format jobs in parallel worker processes.
+    
+    The Twisted reactor behind Scrapy cannot be restarted, so each worker
+    process handles a single job before being replaced.
+    
+    Args:
+        jobs (list): Keyword arguments for scrape_and_format, one dict per job
+        workers (int): Number of worker processes (default: CPU count)
+    
+    Returns:
+        int: Exit code (0 if every job succeeded)
+    """
+    with Pool(processes=workers or os.cpu_count(), maxtasksperchild=1,
+              initializer=setup_logging) as pool:
+        codes = pool.map(_run_job, jobs, chunksize=1)
+    
+    failed = sum(1 for code in codes if code != 0)
+    print(f"Batch completed: {len(jobs) - failed}/{len(jobs)} jobs succeeded")
+    return 1 if failed else 0
 
 
 def main():
@@ -43,80 +132,38 @@ def main():
     word_source = parser.add_mutually_exclusive_group(required=True)
     word_source.add_argument('--word-list', help='File containing list of words to scrape')
     word_source.add_argument('--single-word', help='Single word to scrape')
+    word_source.add_argument('--batch', help='JSON file with a list of scrape jobs to run in parallel')
     
     parser.add_argument('--limit', type=int, help='Maximum number of words to scrape')
     parser.add_argument('--output', default='scraped_data', help='Directory to save output (default: scraped_data)')
     parser.add_argument('--print', action='store_true', help='Print formatted output to console')
+    parser.add_argument('--compress', action='store_true', help='Compress the scraped JSON with zstd (.json.zst)')
+    parser.add_argument('--workers', type=int, help='Worker processes for --batch (default: CPU count)')
     
     args = parser.parse_args()
-    
-    # Build the scraper command
-    cmd = [
-        'python',
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wiktionary_scraper.py'),
-        '--language', args.language,
-        '--output', args.output
-    ]
-    
-    if args.word_list:
-        cmd.extend(['--word-list', args.word_list])
-    elif args.single_word:
-        cmd.extend(['--single-word', args.single_word])
-    
-    if args.limit:
-        cmd.extend(['--limit', str(args.limit)])
-    
-    # Run the scraper
-    print(f"Running scraper with command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
-    if result.returncode != 0:
-        print(f"Error running scraper: {result.stderr}", file=sys.stderr)
-        return result.returncode
-    
-    # Extract the output JSON file path from the scraper output
-    output_file = None
-    for line in result.stdout.split('\n'):
-        if "Stored json feed" in line and "scraped_data/wiktionary_" in line:
-            # Extract filename from the log line
-            parts = line.split("scraped_data/")
-            if len(parts) > 1:
-                filename = parts[1].split(" ")[0].strip().rstrip('.')
-                output_file = os.path.join(args.output, filename)
-                break
-    
-    # If we can't find the output file from logs, try to find the most recent one
-    if not output_file:
-        # Find the most recent json file in the output directory
-        output_dir = Path(args.output)
-        json_files = list(output_dir.glob('wiktionary_*.json'))
-        if json_files:
-            # Sort by modification time, newest first
-            output_file = str(sorted(json_files, key=lambda x: x.stat().st_mtime, reverse=True)[0])
-    
-    if not output_file:
-        print("Could not determine output file from scraper. Aborting.", file=sys.stderr)
-        return 1
-    
-    print(f"Scraper completed successfully. Output saved to: {output_file}")
-    
-    # Format the output
-    print(f"Formatting output file: {output_file}")
-    
-    # Generate output filename for formatted data
-    formatted_dir = os.path.join(args.output, 'formatted')
-    os.makedirs(formatted_dir, exist_ok=True)
-    
-    # Extract the base filename without path or extension
-    base_filename = os.path.basename(output_file)
-    formatted_output = os.path.join(formatted_dir, f"{os.path.splitext(base_filename)[0]}_formatted.md")
-    
-    # Format the JSON file
-    format_json_file(output_file, formatted_output, print_output=args.print)
-    
-    print(f"Formatting completed. Formatted output saved to: {formatted_output}")
-    return 0
+    setup_logging()
+    
+    if args.batch:
+        with open(args.batch, 'r', encoding='utf-8') as f:
+            jobs = json.load(f)
+        # Jobs inherit the command-line defaults for anything they leave out
+        jobs = [
+            {'language': args.language, 'output': args.output, 'limit': args.limit,
+             'print_output': args.print, 'compress': args.compress, **job}
+            for job in jobs
+        ]
+        return run_batch(jobs, workers=args.workers)
+    
+    return scrape_and_format(
+        language=args.language,
+        word_list=args.word_list,
+        single_word=args.single_word,
+        limit=args.limit,
+        output=args.output,
+        print_output=args.print,
+        compress=args.compress
+    )
 
 
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main())
@@ -2,10 +2,16 @@
 Configuration settings for the Mumbl Language Processing System scrapers.
 """
 import os
+import mmap
 import time
-import datetime
+import queue
+import atexit
 import logging
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.util import Finalize
 from pathlib import Path
+from types import MappingProxyType
 
 # Base directories
 BASE_DIR = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,22 +22,75 @@ LOG_DIR = BASE_DIR / "logs"
 SCRAPED_DATA_DIR.mkdir(parents=True, exist_ok=True)
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_DIR / "scraper.log")
-    ]
-)
+# Logging
+# Records are formatted by queue handlers and written to the console and log
+# files by background listener threads, so scraping threads never block on
+# disk writes. Listener threads do not survive fork, so every process that
+# logs (each CLI and each multiprocessing worker) calls setup_logging() itself.
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(message)s'
+LOG_DATEFMT = '%Y-%m-%d %H:%M:%S'
 
-# Setup failed pages logging
 failed_logger = logging.getLogger('failed_pages')
 failed_logger.setLevel(logging.ERROR)
-failed_handler = logging.FileHandler(LOG_DIR / "failed_pages.log")
-failed_handler.setFormatter(logging.Formatter('%(asctime)s - Word: %(message)s'))
-failed_logger.addHandler(failed_handler)
+
+_log_listeners = []
+_logging_pid = None
+
+
+def stop_logging():
+    """Flush queued log records and stop this process's listener threads."""
+    while _log_listeners:
+        _log_listeners.pop().stop()
+
+
+def setup_logging(level=logging.INFO):
+    """
+    Route scraper logging through queue handlers and start their listeners.
+    
+    Replaces any root handlers configured earlier (or inherited over fork)
+    and is a no-op when called again in the same process.
+    
+    Args:
+        level (int): Level for the root logger
+    """
+    global _logging_pid
+    if _logging_pid == os.getpid():
+        return
+    # Listeners copied over fork are dead threads; drop them without joining
+    _log_listeners.clear()
+    _logging_pid = os.getpid()
+    
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(
+        level=level,
+        format=LOG_FORMAT,
+        datefmt=LOG_DATEFMT,
+        handlers=[QueueHandler(log_queue)],
+        force=True
+    )
+    _log_listeners.append(QueueListener(
+        log_queue,
+        logging.StreamHandler(),
+        logging.FileHandler(LOG_DIR / "scraper.log"),
+        respect_handler_level=True
+    ))
+    
+    # Failed pages also get their own file
+    failed_queue = queue.SimpleQueue()
+    failed_handler = QueueHandler(failed_queue)
+    failed_handler.setFormatter(logging.Formatter('%(asctime)s - Word: %(message)s'))
+    for old_handler in failed_logger.handlers[:]:
+        failed_logger.removeHandler(old_handler)
+    failed_logger.addHandler(failed_handler)
+    _log_listeners.append(QueueListener(failed_queue, logging.FileHandler(LOG_DIR / "failed_pages.log")))
+    
+    for listener in _log_listeners:
+        listener.start()
+    # Pool workers leave through os._exit, which skips atexit but runs
+    # multiprocessing finalizers
+    atexit.register(stop_logging)
+    Finalize(None, stop_logging, exitpriority=10)
+
 
 # Scraper settings
 SCRAPER_SETTINGS = {
@@ -41,23 +100,32 @@ SCRAPER_SETTINGS = {
         'fallback_domain': 'en.wiktionary.org',      # Fallback domain if language-specific one fails
         'user_agent': 'Mumbl Language Processing System Spider (educational/research use)',
         'robotstxt_obey': False,  # Set to False to avoid being blocked by robots.txt since we're using word-based access
-        'download_delay': 1.5,  # Seconds between requests
-        'concurrent_requests': 8,
+        'download_delay': 0,  # Pacing is left to AutoThrottle
+        'autothrottle': True,  # Adapt the delay to each wiki's response latency
+        'autothrottle_start_delay': 1.5,  # Seconds; the delay used before latencies are known
+        'concurrent_requests': 256,  # In-flight requests across the non-blocking downloader
+        'concurrent_requests_per_domain': 16,  # Bound on in-flight requests to a single wiki
+        'rate_limit_per_domain': 10,  # Sustained requests per second to a single wiki (0 disables)
+        'rate_limit_burst': 16,  # Requests a wiki may receive back-to-back before pacing starts
+        'dns_cache_size': 500000,  # Resolved hostnames kept in memory
+        'dns_timeout': 5,  # Seconds
+        'reactor_threadpool_size': 40,  # Threads available for DNS resolution
         'max_retries': 3,
-        'timeout': 60,  # Seconds
+        'timeout': 15,  # Seconds
+        'http_cache': True,  # Revalidate previously fetched pages with conditional GETs
         'default_language': 'en',
         'default_limit': 100,
         'output_format': 'json',
         'log_level': 'INFO',
-        'priority_languages': ['en', 'es', 'fr', 'de', 'ja', 'zh'],
-        'extract_fields': [
+        'priority_languages': frozenset({'en', 'es', 'fr', 'de', 'ja', 'zh'}),
+        'extract_fields': frozenset({
             'definitions',
             'pronunciations',
             'examples',
             'etymology',
             'part_of_speech',
             'related_words'
-        ],
+        }),
         # Exponential backoff settings
         'backoff_factor': 2,
         'initial_backoff': 2,  # Initial backoff in seconds
@@ -107,19 +175,32 @@ SCRAPER_SETTINGS = {
         'timeout': 60,
         'output_format': 'json',
         'log_level': 'INFO',
-        'priority_languages': ['en', 'es', 'fr', 'de', 'ja', 'zh'],
-        'grammar_categories': [
+        'priority_languages': frozenset({'en', 'es', 'fr', 'de', 'ja', 'zh'}),
+        'grammar_categories': frozenset({
             'verb_conjugation',
             'noun_declension',
             'adjective_comparison',
             'syntax_patterns',
             'grammar_rules'
-        ],
+        }),
         'show_progress': True,
         'estimate_time': True,
     }
 }
 
+
+def _build_backoff_table(config):
+    """Precompute the backoff delay for every attempt up to max_retries."""
+    factor = config.get('backoff_factor', 2)
+    initial = config.get('initial_backoff', 2)
+    return tuple(initial * (factor ** n) for n in range(config.get('max_retries', 3) + 1))
+
+
+# Attach backoff tables to every scraper that retries with exponential backoff
+for _config in SCRAPER_SETTINGS.values():
+    if 'backoff_factor' in _config:
+        _config['_backoff_table'] = _build_backoff_table(_config)
+
 # Word list sources
 WORD_LIST_SOURCES = {
     'common_english': {
@@ -148,6 +229,8 @@ OUTPUT_SETTINGS = {
     'default_format': 'json',
     'save_raw_html': False,
     'compress_output': True,
+    'compressor': 'zstd',  # Streamed zstd frame; output files get a .zst suffix
+    'compression_level': 3,
     'backup_previous_runs': True,
     'max_backups': 5,
     'skip_validation': True,  # Validation will be handled separately by a dedicated validation subagent.
@@ -161,9 +244,10 @@ PROXY_SETTINGS = {
 }
 
 
+@lru_cache(maxsize=32)
 def get_scraper_config(scraper_name):
-    """Get configuration for a specific scraper."""
-    return SCRAPER_SETTINGS.get(scraper_name, {})
+    """Get configuration for a specific scraper (read-only, cached per scraper)."""
+    return MappingProxyType(SCRAPER_SETTINGS.get(scraper_name, {}))
 
 
 def get_word_list_source(source_name):
@@ -171,6 +255,36 @@ def get_word_list_source(source_name):
     return WORD_LIST_SOURCES.get(source_name, {})
 
 
+def iter_wordlist(path):
+    """
+    Iterate over the words in a word list file, one word per line.
+    
+    The file is memory-mapped, so large lists are paged in on demand rather
+    than read into memory up front. Blank lines are skipped.
+    
+    Args:
+        path (str): Path to the word list file
+    
+    Yields:
+        str: Each word, stripped of surrounding whitespace
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    end = size
+                word = mm[start:end].strip()
+                if word:
+                    yield word.decode('utf-8', 'replace')
+                start = end + 1
+
+
+@lru_cache(maxsize=64)
 def get_domain_for_language(language, scraper_name='wiktionary'):
     """
     Get the appropriate domain for a specific language.
@@ -181,6 +295,11 @@ def get_domain_for_language(language, scraper_name='wiktionary'):
     return base_domain.format(language=language)
 
 
+# Warm the domain cache for the languages scraped most often
+for _language in SCRAPER_SETTINGS['wiktionary']['priority_languages']:
+    get_domain_for_language(_language)
+
+
 def log_failed_page(word, language, reason):
     """
     Log a failed page to the failed_pages.log file.
@@ -204,19 +323,23 @@ def calculate_exponential_backoff(attempt, config):
     Returns:
         float: The number of seconds to wait before retrying
     """
+    table = config.get('_backoff_table')
+    if table is not None and 0 <= attempt < len(table):
+        return table[attempt]
+    
     factor = config.get('backoff_factor', 2)
     initial = config.get('initial_backoff', 2)
     return initial * (factor ** attempt)
 
 
-def log_progress(current, total, start_time):
+def log_progress(current, total, start_ns):
     """
     Log the current progress and estimate remaining time.
     
     Args:
         current (int): Current number of items processed
         total (int): Total number of items to process
-        start_time (float): Time when processing started (from time.time())
+        start_ns (int): Time when processing started (from time.monotonic_ns())
     
     Returns:
         str: A message containing progress information and estimated completion time
@@ -226,15 +349,10 @@ def log_progress(current, total, start_time):
     
     percent_complete = (current / total) * 100
     
-    elapsed = time.time() - start_time
-    if current == 0:
-        eta_seconds = 0
-    else:
-        items_per_second = current / elapsed
-        remaining_items = total - current
-        eta_seconds = remaining_items / items_per_second if items_per_second > 0 else 0
-    
-    eta = datetime.timedelta(seconds=int(eta_seconds))
+    # Remaining items at the average rate so far, in whole seconds
+    elapsed_ns = time.monotonic_ns() - start_ns
+    eta_seconds = (total - current) * elapsed_ns // current // 1_000_000_000
+    eta = f"{eta_seconds // 3600}:{eta_seconds // 60 % 60:02d}:{eta_seconds % 60:02d}"
     
     return f"[PROGRESS] {current} of {total} words processed ({percent_complete:.1f}% complete, ETA: {eta})"
 
@@ -13,48 +13,107 @@ import logging
 import scrapy
 import sys
 from scrapy.crawler import CrawlerProcess
+from scrapy.exceptions import NotConfigured
+from scrapy.exporters import JsonItemExporter
+from scrapy.http import TextResponse
 from scrapy.spidermiddlewares.httperror import HttpError
 from twisted.internet.error import DNSLookupError, TimeoutError, TCPTimedOutError
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
+from itertools import islice
+from lxml import etree
 import argparse
+import importlib.util
+
+try:
+    import orjson
+except ImportError:  # Fall back to Scrapy's stdlib-based JSON exporter
+    orjson = None
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
+# Text cleanup patterns
+_CITATION_RE = re.compile(r'\[\d+\]')  # Citation markers like [1], [2]
+
 # Import local modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_config import get_connection_string, get_connection_dict
 from scraper.scraper_config import (
-    get_scraper_config, get_domain_for_language, 
+    OUTPUT_SETTINGS, get_scraper_config, get_domain_for_language, 
     log_failed_page, calculate_exponential_backoff, log_progress,
-    generate_word_list, get_grammar_rule_sources
+    generate_word_list, get_grammar_rule_sources, iter_wordlist, setup_logging
 )
+from scraper.format_output import COMPRESSED_SUFFIX, output_stem
+
+
+def _has_class(name):
+    """XPath predicate matching elements with the given CSS class."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
 
 
 class WiktionarySpider(scrapy.Spider):
     """Spider for scraping Wiktionary definitions."""
     name = 'wiktionary_spider'
     
-    def __init__(self, language='en', words=None, output_filename=None, *args, **kwargs):
+    # Words between [PROGRESS] log lines; per-word details are logged at DEBUG
+    progress_interval = 100
+    
+    # Smallest body that can be a real entry page; shorter or non-200 responses
+    # are recorded as failures without being parsed
+    min_page_bytes = 1024
+    
+    # Page selectors, compiled once and evaluated against the parsed lxml tree.
+    # smart_strings=False returns plain str results that do not pin the tree.
+    _XP_DEFS = etree.XPath('//ol/li')
+    _XP_DEF_TEXT = etree.XPath('.//text()', smart_strings=False)
+    _XP_DEF_SPAN_TEXT = etree.XPath('.//span/text()', smart_strings=False)
+    _XP_IPA = etree.XPath(f'//span[{_has_class("IPA")}]/text()', smart_strings=False)
+    _XP_QUOTES = etree.XPath('//dl//dd//cite/text() | //dl//dd/text()', smart_strings=False)
+    _XP_USAGE = etree.XPath(f'//div[{_has_class("usage-example")}]/text()', smart_strings=False)
+    _XP_RELATED = etree.XPath(
+        '//div[@id="Synonyms" or @id="Antonyms" or @id="Related_terms"]//li//a/text()',
+        smart_strings=False
+    )
+    
+    def __init__(self, language='en', words=None, output_filename=None, manifest_path=None,
+                 words_path=None, limit=None, *args, **kwargs):
         """Initialize the spider with configuration parameters."""
         super(WiktionarySpider, self).__init__(*args, **kwargs)
-        self.language = language
-        self.primary_domain = f"{language}.wiktionary.org"
+        self.language = sys.intern(language)
+        self.primary_domain = sys.intern(f"{language}.wiktionary.org")
         self.fallback_domain = "en.wiktionary.org"  # Fallback to English if primary language is not available
+        # One shared copy of strings that recur across words (IPA, related words)
+        self._str_pool = {}
+        # Words come either as a list or, for large lists, streamed from a
+        # word list file so the spider never holds them all in memory
         self.words = words or []
+        self.words_path = words_path
+        self.limit = limit if limit and limit > 0 else None
         self.word_count = 0
-        self.total_words = len(self.words)
+        if words_path:
+            self.total_words = sum(1 for _ in self.iter_words())
+        else:
+            self.total_words = len(self.words)
         self.output_filename = output_filename
         self.total_successes = 0
         self.total_failures = 0
         self.start_time = datetime.now()
+        self.start_ns = time.monotonic_ns()
+        # Scrape timestamps are second-resolution, so one string serves every
+        # record scraped within the same second
+        self._scrape_second = None
+        self._scrape_date = None
+        
+        # Page validators (ETag or Last-Modified) from previous runs, keyed by URL.
+        # When a manifest is given, pages are probed with HEAD and only fetched
+        # if their validator has changed.
+        self.manifest_path = manifest_path
+        self.manifest = {}
+        self.skipped_unchanged = 0
+        if manifest_path and os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
         
         # Log basic info
         logger.info(f"Starting scraper: Target language: {language}, "
@@ -64,21 +123,53 @@ class WiktionarySpider(scrapy.Spider):
         if self.total_words:
             logger.info(f"Will process up to {self.total_words} words")
     
+    def iter_words(self):
+        """Iterate over the words to scrape, reading the word list file on demand."""
+        if self.words_path:
+            return islice(iter_wordlist(self.words_path), self.limit)
+        return iter(self.words)
+    
     def start_requests(self):
         """Generate initial requests to scrape words."""
-        for word in self.words:
+        for word in self.iter_words():
             if word.strip():  # Skip empty words
                 url = f"https://{self.primary_domain}/wiki/{word.strip()}"
-                yield scrapy.Request(url, callback=self.parse, meta={'word': word.strip()})
+                if self.manifest_path:
+                    # Probes always go to the server; a cached HEAD would hide changes
+                    yield scrapy.Request(url, method='HEAD', callback=self._maybe_fetch,
+                                         meta={'word': word.strip(), 'dont_cache': True})
+                else:
+                    yield scrapy.Request(url, callback=self.parse, meta={'word': word.strip()})
+    
+    def _maybe_fetch(self, response):
+        """Fetch the page behind a HEAD probe unless it is unchanged since the last run."""
+        word = response.meta['word']
+        validator = response.headers.get(b'ETag') or response.headers.get(b'Last-Modified')
+        validator = validator.decode('latin-1') if validator else None
+        
+        if validator and self.manifest.get(response.url) == validator:
+            self.skipped_unchanged += 1
+            logger.debug(f"Skipping unchanged word: {word}")
+            return
+        
+        yield scrapy.Request(response.url, callback=self.parse,
+                             meta={'word': word, 'validator': validator})
+    
+    def record_validator(self, response, data):
+        """Remember the page's validator once its entry has been extracted."""
+        validator = response.meta.get('validator')
+        if validator and 'error' not in data:
+            self.manifest[response.url] = validator
     
     def parse(self, response):
         """Parse the Wiktionary page for the word."""
         word = response.meta.get('word', '')
-        logger.info(f"Processing word: {word}")
+        logger.debug(f"Processing word: {word}")
         self.word_count += 1
         
         # Extract data
         result = self.extract_data(response, word)
+        self.record_validator(response, result)
         
         # Update progress
         self.update_progress()
@@ -98,65 +189,60 @@ class WiktionarySpider(scrapy.Spider):
             'etymology': [],
             'related_words': [],
             'url': response.url,
-            'scrape_date': datetime.now().isoformat()
+            'scrape_date': self.scrape_date()
         }
         
+        # Skip parsing error, empty and non-HTML pages
+        if (response.status != 200 or len(response.body) < self.min_page_bytes
+                or not isinstance(response, TextResponse)):
+            self.total_failures += 1
+            log_failed_page(word, self.language,
+                            f"empty or error page (HTTP {response.status}, {len(response.body)} bytes)")
+            data['error'] = 'empty/error'
+            return data
+        
         # Extract definitions using direct extraction
         definitions = self.extract_definitions(response)
         data['definitions'] = definitions
-        logger.info(f"Found {len(definitions)} definitions using direct extraction")
-        
-        # Clean up definitions to remove duplicates and empty entries
-        cleaned_definitions = self.clean_definitions(definitions)
-        data['definitions'] = cleaned_definitions
-        logger.info(f"Cleaned up definitions, keeping {len(cleaned_definitions)} valid entries")
+        logger.debug(f"Found {len(definitions)} unique definitions using direct extraction")
         
         # Extract pronunciations
         pronunciations = self.extract_pronunciations(response)
         data['pronunciations'] = pronunciations
-        logger.info(f"Found {len(pronunciations)} unique pronunciations")
+        logger.debug(f"Found {len(pronunciations)} unique pronunciations")
         
         # Extract examples
         examples = self.extract_examples(response)
         data['examples'] = examples
-        logger.info(f"Found {len(examples)} clean examples")
+        logger.debug(f"Found {len(examples)} clean examples")
         
         # Extract related words
         related_words = self.extract_related_words(response)
         if related_words:
             data['related_words'] = related_words
         else:
-            logger.warning(f"No related words found for {word}")
+            logger.debug(f"No related words found for {word}")
         
         return data
     
-    def clean_definitions(self, definitions):
-        """Clean up definitions, remove duplicates and empty entries."""
-        # Remove empty entries
-        cleaned = [d for d in definitions if d.strip()]
-        # Remove exact duplicates
-        cleaned = list(dict.fromkeys(cleaned))
-        return cleaned
-    
     def extract_definitions(self, response):
-        """Extract definitions from the Wiktionary page."""
+        """Extract definitions from the Wiktionary page, skipping empty and duplicate entries."""
         definitions = []
+        seen = set()
         
         # Extract from definition sections
-        def_elements = response.css('ol > li')
-        for elem in def_elements:
+        for elem in self._XP_DEFS(response.selector.root):
             # Get text directly from the list item
-            def_text = elem.css('::text').getall()
-            def_text = ' '.join([t.strip() for t in def_text if t.strip()])
+            def_text = ' '.join([t.strip() for t in self._XP_DEF_TEXT(elem) if t.strip()])
             
             # Also get text from spans inside the list item
-            span_text = elem.css('span::text').getall()
-            span_text = ' '.join([t.strip() for t in span_text if t.strip()])
+            span_text = ' '.join([t.strip() for t in self._XP_DEF_SPAN_TEXT(elem) if t.strip()])
             
             # Combine them
             combined_text = ' '.join([t for t in [def_text, span_text] if t])
             
-            if combined_text:
+            if combined_text and combined_text not in seen:
+                seen.add(combined_text)
                 definitions.append(combined_text)
         
         return definitions
@@ -164,69 +250,70 @@ class WiktionarySpider(scrapy.Spider):
     def extract_pronunciations(self, response):
         """Extract pronunciations from the Wiktionary page."""
         pronunciations = []
+        seen = set()
         
-        # Extract IPA pronunciations (common format in Wiktionary)
-        ipa_elements = response.css('span.IPA::text').getall()
-        pronunciations.extend([p.strip() for p in ipa_elements if p.strip()])
-        
-        # Also try to get pronunciations from lists
-        pron_lists = response.css('li span.IPA::text').getall()
-        pronunciations.extend([p.strip() for p in pron_lists if p.strip()])
+        # Extract unique IPA pronunciations (common format in Wiktionary);
+        # this also covers IPA spans inside pronunciation lists
+        for p in self._XP_IPA(response.selector.root):
+            p = p.strip()
+            if p and p not in seen:
+                seen.add(p)
+                pronunciations.append(self._str_pool.setdefault(p, p))
         
-        # Remove duplicates
-        return list(dict.fromkeys(pronunciations))
+        return pronunciations
     
     def extract_examples(self, response):
         """Extract examples from the Wiktionary page."""
         examples = []
+        root = response.selector.root
         
         # Extract examples from quotes
-        quote_elements = response.css('dl dd cite::text, dl dd::text').getall()
-        examples.extend([q.strip() for q in quote_elements if q.strip()])
+        examples.extend([q.strip() for q in self._XP_QUOTES(root) if q.strip()])
         
         # Extract examples from usage sections
-        usage_elements = response.css('div.usage-example::text').getall()
-        examples.extend([u.strip() for u in usage_elements if u.strip()])
+        examples.extend([u.strip() for u in self._XP_USAGE(root) if u.strip()])
         
         # Clean examples
         cleaned_examples = []
+        seen = set()
         for example in examples:
-            # Remove citation markers like [1], [2], etc.
-            cleaned = re.sub(r'\[\d+\]', '', example)
-            # Remove empty or too short examples
-            if cleaned and len(cleaned) > 5:
+            # Remove citation markers like [1], [2], etc.; most examples have
+            # no brackets at all, so skip the regex for those
+            cleaned = _CITATION_RE.sub('', example) if '[' in example else example
+            # Remove empty, too short or duplicate examples
+            if cleaned and len(cleaned) > 5 and cleaned not in seen:
+                seen.add(cleaned)
                 cleaned_examples.append(cleaned)
         
         return cleaned_examples
     
     def extract_related_words(self, response):
         """Extract related words from the Wiktionary page."""
-        related = []
-        
         # Extract from synonym/antonym sections
-        related_sections = response.css('div#Synonyms, div#Antonyms, div#Related_terms')
-        for section in related_sections:
-            words = section.css('li a::text').getall()
-            related.extend([w.strip() for w in words if w.strip()])
-        
+        pool = self._str_pool
+        related = []
+        for w in self._XP_RELATED(response.selector.root):
+            w = w.strip()
+            if w:
+                related.append(pool.setdefault(w, w))
         return related
     
+    def scrape_date(self):
+        """Return the current time as an ISO 8601 string, cached per second."""
+        second = int(time.time())
+        if second != self._scrape_second:
+            self._scrape_second = second
+            self._scrape_date = datetime.fromtimestamp(second).isoformat()
+        return self._scrape_date
+    
     def update_progress(self):
-        """Update and log progress."""
+        """Update and log progress every progress_interval words and at the end."""
         if self.total_words <= 0:
             return
-            
-        progress = (self.word_count / self.total_words) * 100
-        
-        # Calculate ETA
-        elapsed = (datetime.now() - self.start_time).total_seconds()
-        words_per_second = self.word_count / elapsed if elapsed > 0 else 0
-        remaining_words = self.total_words - self.word_count
-        eta_seconds = remaining_words / words_per_second if words_per_second > 0 else 0
-        eta = str(timedelta(seconds=int(eta_seconds)))
+        if self.word_count % self.progress_interval and self.word_count != self.total_words:
+            return
         
-        logger.info(f"[PROGRESS] {self.word_count} of {self.total_words} words processed "
-                   f"({progress:.1f}% complete, ETA: {eta})")
+        logger.info(log_progress(self.word_count, self.total_words, self.start_ns))
         
     def closed(self, reason):
         """Called when the spider is closed."""
@@ -234,7 +321,14 @@ class WiktionarySpider(scrapy.Spider):
         logger.info("="*70)
         logger.info(f"Spider closed: {reason}")
         logger.info(f"Processed {self.word_count} words with {self.total_failures} failures in {duration_to_string(duration)}")
+        if self.manifest_path:
+            logger.info(f"Skipped {self.skipped_unchanged} unchanged words")
         logger.info("="*70)
+        
+        # Persist validators so the next run can skip pages that have not changed
+        if self.manifest_path:
+            with open(self.manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(self.manifest, f)
 
 
 # Placeholder for future grammar rule extraction
@@ -268,8 +362,31 @@ class FormattedWiktionarySpider(WiktionarySpider):
     def __init__(self, print_formatted=False, *args, **kwargs):
         """Initialize the spider with configuration parameters."""
         super(FormattedWiktionarySpider, self).__init__(*args, **kwargs)
-        self.formatted_words = []
         self.print_formatted = print_formatted
+        
+        # Formatted entries are streamed to disk as words are parsed; the file is
+        # opened with the first entry so runs without data leave no file behind
+        self.formatted_output = None
+        self._fmt_fh = None
+    
+    def write_formatted(self, formatted_data):
+        """Append a formatted entry to the output file (and console, if requested)."""
+        header = "="*80 + f"\nFORMATTED OUTPUT FOR {self.language.upper()}\n" + "="*80
+        if self._fmt_fh is None:
+            formatted_dir = os.path.join(os.path.dirname(self.output_filename), 'formatted')
+            os.makedirs(formatted_dir, exist_ok=True)
+            self.formatted_output = os.path.join(formatted_dir, f"{output_stem(self.output_filename)}_formatted.md")
+            self._fmt_fh = open(self.formatted_output, 'w', encoding='utf-8', buffering=1 << 20)
+            self._fmt_fh.write("\n\n" + header + "\n\n")
+            if self.print_formatted:
+                print("\n\n")
+                print(header)
+                print("\n\n")
+        
+        self._fmt_fh.write(formatted_data)
+        self._fmt_fh.write("\n\n")
+        if self.print_formatted:
+            print(formatted_data, end="\n\n")
     
     def format_word_data(self, word_data):
         """Format word data into a readable markdown format."""
@@ -286,7 +403,7 @@ class FormattedWiktionarySpider(WiktionarySpider):
             formatted.append("**Definitions:**")
             for i, definition in enumerate(word_data['definitions'][:15], 1):
                 # Clean and limit length
-                def_text = re.sub(r'\s+', ' ', definition).strip()
+                def_text = ' '.join(definition.split())
                 if len(def_text) > 100:
                     def_text = def_text[:97] + "..."
                 formatted.append(f"    {i}. {def_text}")
@@ -303,7 +420,7 @@ class FormattedWiktionarySpider(WiktionarySpider):
         if word_data.get('examples'):
             formatted.append("**Examples:**")
             for example in word_data['examples'][:10]:
-                example_text = re.sub(r'\s+', ' ', example).strip()
+                example_text = ' '.join(example.split())
                 if len(example_text) > 100:
                     example_text = example_text[:97] + "..."
                 formatted.append(f"    • \"{example_text}\"")
@@ -319,11 +436,15 @@ class FormattedWiktionarySpider(WiktionarySpider):
     
     def parse(self, response):
         """Parse the Wiktionary page for the word."""
-        word_data = super().extract_data(response, response.meta.get('word', ''))
+        word = response.meta.get('word', '')
+        logger.debug(f"Processing word: {word}")
+        self.word_count += 1
+        word_data = super().extract_data(response, word)
+        self.record_validator(response, word_data)
         
-        # Format the word data and store it
-        formatted_data = self.format_word_data(word_data)
-        self.formatted_words.append(formatted_data)
+        # Format the word data and write it out; error pages carry no entry
+        if 'error' not in word_data:
+            self.write_formatted(self.format_word_data(word_data))
         
         # Update progress
         self.update_progress()
@@ -334,41 +455,114 @@ class FormattedWiktionarySpider(WiktionarySpider):
         """Called when the spider is closed."""
         super().closed(reason)
         
-        # Save formatted output if there is any data
-        if self.formatted_words:
-            # Create formatted directory
-            formatted_dir = os.path.join(os.path.dirname(self.output_filename), 'formatted')
-            os.makedirs(formatted_dir, exist_ok=True)
-            
-            # Generate output filename for formatted data
-            base_filename = os.path.basename(self.output_filename)
-            formatted_output = os.path.join(formatted_dir, f"{os.path.splitext(base_filename)[0]}_formatted.md")
-            
-            # Write to file
-            with open(formatted_output, 'w', encoding='utf-8') as f:
-                f.write("\n\n")
-                f.write("="*80)
-                f.write(f"\nFORMATTED OUTPUT FOR {self.language.upper()}\n")
-                f.write("="*80)
-                f.write("\n\n")
-                f.write("\n\n".join(self.formatted_words))
-                f.write("\n\n")
+        # Finish the formatted output if any data was written
+        if self._fmt_fh is not None:
+            self._fmt_fh.close()
+            logger.info(f"Formatted output saved to {self.formatted_output}")
             
-            logger.info(f"Formatted output saved to {formatted_output}")
-            
-            # Print to console if requested
             if self.print_formatted:
                 print("\n\n")
-                print("="*80)
-                print(f"FORMATTED OUTPUT FOR {self.language.upper()}")
-                print("="*80)
-                print("\n\n")
-                print("\n\n".join(self.formatted_words))
-                print("\n\n")
+
+
+def url_netloc(url):
+    """Return the network location of an absolute URL without a full urlparse."""
+    parts = url.split('/', 3)
+    return parts[2] if len(parts) > 2 else ''
+
+
+class PerDomainRateLimitMiddleware:
+    """
+    Downloader middleware that rate-limits each domain with its own token bucket.
+    
+    Every domain may take DOMAIN_RATE_LIMIT_BURST requests back-to-back and is
+    then held to DOMAIN_RATE_LIMIT requests per second. Requests to other
+    domains are never delayed by a busy one.
+    """
+    
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}  # netloc -> (tokens, last refill time)
+    
+    @classmethod
+    def from_crawler(cls, crawler):
+        rate = crawler.settings.getfloat('DOMAIN_RATE_LIMIT')
+        if rate <= 0:
+            raise NotConfigured
+        return cls(rate, max(1, crawler.settings.getint('DOMAIN_RATE_LIMIT_BURST', 1)))
+    
+    def process_request(self, request, spider):
+        netloc = url_netloc(request.url)
+        now = time.monotonic()
+        tokens, last = self.buckets.get(netloc, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate) - 1
+        self.buckets[netloc] = (tokens, now)
+        
+        if tokens < 0:
+            # The token is reserved; hold the request until it is due
+            from twisted.internet import reactor
+            from twisted.internet.task import deferLater
+            return deferLater(reactor, -tokens / self.rate, lambda: None)
+        return None
+
+
+class OrjsonItemExporter(JsonItemExporter):
+    """JSON feed exporter that encodes each item with orjson."""
+    
+    def export_item(self, item):
+        # Encode before writing the separator so an item that fails to
+        # serialize leaves the feed valid
+        data = orjson.dumps(dict(self._get_serialized_fields(item)))
+        if self.first_item:
+            self.first_item = False
+        else:
+            self.file.write(b",\n" if self.indent is not None else b",")
+        self.file.write(data)
+
+
+class ZstdPlugin:
+    """
+    Feed post-processing plugin that compresses the export with zstd.
+    
+    Accepts the ``zstd_compresslevel`` feed option (default 3).
+    """
+    
+    def __init__(self, file, feed_options):
+        import zstandard
+        self.file = file
+        level = feed_options.get('zstd_compresslevel', 3)
+        self.writer = zstandard.ZstdCompressor(level=level).stream_writer(file, closefd=False)
+    
+    def write(self, data):
+        return self.writer.write(data)
+    
+    def close(self):
+        # Flushes the final zstd frame; the feed storage closes the file itself
+        self.writer.close()
+
+
+ASYNCIO_REACTOR = 'twisted.internet.asyncioreactor.AsyncioSelectorReactor'
+
+
+def reactor_settings():
+    """
+    Build the reactor settings for the crawler process.
+    
+    The crawl runs on Twisted's asyncio reactor; where uvloop is installed
+    (it is POSIX-only) it drives the underlying event loop.
+    
+    Returns:
+        dict: Scrapy settings selecting the reactor and event loop
+    """
+    settings = {'TWISTED_REACTOR': ASYNCIO_REACTOR}
+    if sys.platform != 'win32' and importlib.util.find_spec('uvloop') is not None:
+        settings['ASYNCIO_EVENT_LOOP'] = 'uvloop.Loop'
+    return settings
 
 
 def run_spider(language="en", words=None, output_dir="scraped_data", 
-            formatted=False, print_output=False):
+            formatted=False, print_output=False, compress=False, incremental=False,
+            words_path=None, limit=None):
     """
     Run the Wiktionary spider to scrape word definitions.
     
@@ -378,6 +572,10 @@ def run_spider(language="en", words=None, output_dir="scraped_data",
         output_dir (str): Directory to save output.
         formatted (bool): Whether to use formatted output.
         print_output (bool): Whether to print formatted output to console.
+        compress (bool): Whether to compress the JSON output (written as .json.zst).
+        incremental (bool): Whether to skip pages unchanged since the last incremental run.
+        words_path (str): Word list file to stream words from instead of ``words``.
+        limit (int): Maximum number of words to read from ``words_path``.
     """
     # Create the output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
@@ -386,6 +584,18 @@ def run_spider(language="en", words=None, output_dir="scraped_data",
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_filename = os.path.join(output_dir, f"wiktionary_{language}_{timestamp}.json")
     
+    # Feed export options; compressed output is streamed through zstd as it is written.
+    # Text is written as UTF-8 rather than \u-escaped ASCII, which keeps IPA
+    # transcriptions and non-Latin scripts compact (2-3 bytes per character, not 6).
+    feed_options = {'format': 'json', 'encoding': 'utf8'}
+    if compress:
+        output_filename += COMPRESSED_SUFFIX
+        feed_options['postprocessing'] = [ZstdPlugin]
+        feed_options['zstd_compresslevel'] = OUTPUT_SETTINGS['compression_level']
+    
+    # Encode JSON feed items with orjson when it is available
+    feed_exporters = {'json': OrjsonItemExporter} if orjson is not None else {}
+    
     # Determine which spider class to use
     spider_class = FormattedWiktionarySpider if formatted else WiktionarySpider
     
@@ -393,33 +603,130 @@ def run_spider(language="en", words=None, output_dir="scraped_data",
     spider_kwargs = {
         'language': language,
         'words': words,
+        'words_path': words_path,
+        'limit': limit,
         'output_filename': output_filename,
     }
     
+    # Incremental runs track page validators in a manifest next to the output
+    if incremental:
+        spider_kwargs['manifest_path'] = os.path.join(output_dir, f".manifest_{language}.json")
+    
     # Add print_formatted flag only if needed
     if formatted and print_output:
         spider_kwargs['print_formatted'] = True
     
+    # Size and pace the downloader from the scraper configuration
+    config = get_scraper_config('wiktionary')
+    
+    # LOG_STDOUT points sys.stdout at the log when the process is created and
+    # Scrapy never puts it back, so the streams are restored for in-process callers
+    stdout, stderr = sys.stdout, sys.stderr
+    
     # Set up the crawler process
     process = CrawlerProcess(settings={
-        'USER_AGENT': 'Mumbl Language Processing System Spider (educational/research use)',
+        'USER_AGENT': config['user_agent'],
         'LOG_LEVEL': 'INFO',
         'LOG_STDOUT': True,
-        'FEED_URI': f'file:{output_filename}',
-        'FEED_FORMAT': 'json',
-        'DOWNLOAD_DELAY': 1.5,  # Be nice to the server
-        'CONCURRENT_REQUESTS': 8,
+        'FEEDS': {f'file:{output_filename}': feed_options},
+        'FEED_EXPORTERS': feed_exporters,
+        'DOWNLOAD_DELAY': config['download_delay'],
+        'AUTOTHROTTLE_ENABLED': config['autothrottle'],  # Be nice to the server
+        'AUTOTHROTTLE_START_DELAY': config['autothrottle_start_delay'],
+        'DOWNLOAD_TIMEOUT': config['timeout'],
+        'CONCURRENT_REQUESTS': config['concurrent_requests'],
+        'CONCURRENT_REQUESTS_PER_DOMAIN': config['concurrent_requests_per_domain'],
+        'DOMAIN_RATE_LIMIT': config['rate_limit_per_domain'],
+        'DOMAIN_RATE_LIMIT_BURST': config['rate_limit_burst'],
+        'DOWNLOADER_MIDDLEWARES': {PerDomainRateLimitMiddleware: 600},
+        'DNSCACHE_ENABLED': True,
+        'DNSCACHE_SIZE': config['dns_cache_size'],
+        'DNS_TIMEOUT': config['dns_timeout'],
+        'REACTOR_THREADPOOL_MAXSIZE': config['reactor_threadpool_size'],
+        'SCHEDULER_PRIORITY_QUEUE': 'scrapy.pqueues.DownloaderAwarePriorityQueue',
+        # Cache pages across runs; RFC2616Policy revalidates them with
+        # If-None-Match/If-Modified-Since so unchanged pages come back as 304s
+        'HTTPCACHE_ENABLED': config['http_cache'],
+        'HTTPCACHE_POLICY': 'scrapy.extensions.httpcache.RFC2616Policy',
+        'HTTPCACHE_STORAGE': 'scrapy.extensions.httpcache.FilesystemCacheStorage',
+        'HTTPCACHE_DIR': os.path.abspath(os.path.join(output_dir, '.httpcache')),
+        'HTTPCACHE_ALWAYS_STORE': True,
         'RETRY_ENABLED': False,  # Don't retry failed requests to avoid hammering the server
+        **reactor_settings(),
     })
     
     # Start the crawler
-    process.crawl(spider_class, **spider_kwargs)
-    process.start()
+    try:
+        process.crawl(spider_class, **spider_kwargs)
+        process.start()
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
     
     logger.info(f"Scraping completed. Data saved to {output_filename}")
     return output_filename
 
 
+def run_scrape(language='en', word_list=None, single_word=None, limit=None,
+               output='scraped_data', formatted=False, print_output=False, compress=False,
+               incremental=False):
+    """
+    Load the words to scrape and run the spider over them.
+    
+    Args:
+        language (str): Language code to scrape.
+        word_list (str): File containing list of words to scrape.
+        single_word (str): Single word to scrape instead of a word list.
+        limit (int): Maximum number of words to scrape.
+        output (str): Directory to save output.
+        formatted (bool): Whether to use formatted output.
+        print_output (bool): Whether to print formatted output to console.
+        compress (bool): Whether to compress the JSON output with zstd.
+        incremental (bool): Whether to skip pages unchanged since the last incremental run.
+    
+    Returns:
+        str: Path to the JSON output file, or None if there were no words to process
+    """
+    os.makedirs(output, exist_ok=True)
+    
+    # Create word list to use; word list files are streamed by the spider
+    words = []
+    if word_list:
+        # Make sure the file is readable and has at least one word
+        try:
+            has_words = next(iter_wordlist(word_list), None) is not None
+        except Exception as e:
+            logger.error(f"Error loading word list: {e}")
+            return None
+        if not has_words:
+            logger.error("No words to process. Exiting.")
+            return None
+        logger.info(f"Streaming words from {word_list}")
+    elif single_word:
+        # Use the single word provided
+        words = [single_word]
+        logger.info(f"Using single word: {single_word}")
+        
+    if not words and not word_list:
+        logger.error("No words to process. Exiting.")
+        return None
+        
+    if limit and limit > 0:
+        words = words[:limit]
+        
+    # Run the spider with the specified arguments
+    return run_spider(
+        language=language, 
+        words=words, 
+        words_path=word_list,
+        limit=limit,
+        output_dir=output,
+        formatted=formatted,
+        print_output=print_output,
+        compress=compress,
+        incremental=incremental
+    )
+
+
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(description='Scrape Wiktionary for word definitions')
@@ -434,45 +741,26 @@ def main():
     parser.add_argument('--output', default='scraped_data', help='Directory to save output (default: scraped_data)')
     parser.add_argument('--formatted', action='store_true', help='Save output in formatted markdown format')
     parser.add_argument('--print', action='store_true', help='Print formatted output to console')
+    parser.add_argument('--compress', action='store_true', help='Compress the JSON output with zstd (.json.zst)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Probe pages with HEAD and skip those unchanged since the last incremental run')
     
     args = parser.parse_args()
+    setup_logging()
     
-    output_dir = args.output
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Create word list to use
-    words = []
-    if args.word_list:
-        # Load words from file
-        try:
-            with open(args.word_list, 'r', encoding='utf-8') as f:
-                words = [line.strip() for line in f if line.strip()]
-            logger.info(f"Loaded {len(words)} words from {args.word_list}")
-        except Exception as e:
-            logger.error(f"Error loading word list: {e}")
-            return 1
-    elif args.single_word:
-        # Use the single word provided
-        words = [args.single_word]
-        logger.info(f"Using single word: {args.single_word}")
-        
-    if not words:
-        logger.error("No words to process. Exiting.")
-        return 1
-        
-    if args.limit and args.limit > 0:
-        words = words[:args.limit]
-        
-    # Run the spider with the specified arguments
-    run_spider(
-        language=args.language, 
-        words=words, 
-        output_dir=output_dir,
+    output_file = run_scrape(
+        language=args.language,
+        word_list=args.word_list,
+        single_word=args.single_word,
+        limit=args.limit,
+        output=args.output,
         formatted=args.formatted,
-        print_output=args.print
+        print_output=args.print,
+        compress=args.compress,
+        incremental=args.incremental
     )
     
-    return 0
+    return 0 if output_file else 1
 
 
 if __name__ == "__main__":
@@ -9,10 +9,14 @@ import os
 import re
 import json
 import logging
+from collections import Counter
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import MemoryHandler
 import psycopg2
-from psycopg2.extras import DictCursor
+from psycopg2.extras import DictCursor, execute_values
 
 # Import local modules
 import sys
@@ -20,11 +24,20 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_config import get_connection_dict
 
 # Set up logging
+# The log file is opened on the first flush; records are buffered in memory
+# and written in blocks, or straight away for errors.
+LOG_DIR = Path(__file__).resolve().parent.parent / 'logs'
+LOG_DIR.mkdir(exist_ok=True)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_file_handler = logging.FileHandler(
+    LOG_DIR / f"phonetics_agent_{datetime.now().strftime('%Y%m%d')}.log", delay=True
+)
+_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler(f"logs/phonetics_agent_{datetime.now().strftime('%Y%m%d')}.log"),
+        MemoryHandler(1024, flushLevel=logging.ERROR, target=_file_handler),
         logging.StreamHandler()
     ]
 )
@@ -74,6 +87,154 @@ DIALECT_PATTERNS = {
     },
 }
 
+# IPA_NORMALIZATION as a single-pass translation table (identity mappings
+# dropped); mappings with multi-character sources are applied separately
+_IPA_TRANSLATE = str.maketrans({
+    old: new for old, new in IPA_NORMALIZATION.items() if len(old) == 1 and old != new
+})
+_IPA_MULTI = {old: new for old, new in IPA_NORMALIZATION.items() if len(old) != 1}
+
+# Precompiled patterns for the per-row normalization and analysis loops
+_RE_STRIP_BRACKETS = re.compile(r'^[/\[\(]|[/\]\)]$')
+_RE_STRESS = re.compile(r'[ˈˌ]')
+_RE_RHOTIC = re.compile(r'[ɹɻrɾ](?:$|[^aeiouəɑɛɪɔʊʌæɒ])')
+_RE_PHONEMES = re.compile(r'[^\s\-\.]+')
+
+# Vowels in either case (İ and ı are the case variants Python's regex
+# engine also treats as i)
+_VOWEL_CHARS = 'aeiouæɑɛɪɔʊʌəɒ'
+_VOWELS = frozenset(_VOWEL_CHARS + _VOWEL_CHARS.upper() + 'İı')
+
+# Consonant clusters, with the case variants spelled out rather than matched
+# through re.IGNORECASE (ſ, ϑ, ϴ and the Kelvin sign are the extra variants
+# it folds s, θ and k to)
+_CONSONANT_CHARS = 'bcdfghjklmnpqrstvwxyzðθʃʒŋɹɾɻ'
+_RE_CLUSTERS = re.compile(f"[{_CONSONANT_CHARS}{_CONSONANT_CHARS.upper()}ſϑϴ\u212a]{{2,}}")
+
+@lru_cache(maxsize=4096)
+def has_rhotic_r(ipa_string):
+    """Return whether an IPA string pronounces 'r' outside a pre-vocalic position."""
+    return _RE_RHOTIC.search(ipa_string) is not None
+
+
+def count_vowel_runs(ipa_string):
+    """Return the number of runs of consecutive vowels in an IPA string."""
+    vowels = _VOWELS
+    runs = 0
+    in_vowel = False
+    for char in ipa_string:
+        is_vowel = char in vowels
+        if is_vowel and not in_vowel:
+            runs += 1
+        in_vowel = is_vowel
+    return runs
+
+
+# DIALECT_PATTERNS with each pattern compiled, its feature name built and its
+# expected options split:
+# dialect -> {'rhoticity': bool, 'patterns': [(compiled, feature, options)]}
+_DIALECT_PATTERNS_COMPILED = {
+    dialect: {
+        'rhoticity': properties['rhoticity'],
+        'patterns': [
+            (re.compile(pattern), f"{dialect}_{pattern}", tuple(expected.split('|')))
+            for pattern, expected in properties['patterns'].items()
+        ],
+    }
+    for dialect, properties in DIALECT_PATTERNS.items()
+}
+
+
+@lru_cache(maxsize=8192)
+def _normalize_ipa(ipa_string):
+    """
+    Normalize IPA pronunciation by applying standard conventions.
+
+    Cached, as the same transcriptions recur across many words.
+
+    Args:
+        ipa_string (str): IPA pronunciation string
+
+    Returns:
+        str: Normalized IPA string
+    """
+    if not ipa_string:
+        return None
+
+    # Remove enclosing slashes or brackets if present
+    ipa_string = _RE_STRIP_BRACKETS.sub('', ipa_string)
+
+    # Apply normalization mappings
+    ipa_string = ipa_string.translate(_IPA_TRANSLATE)
+    for old, new in _IPA_MULTI.items():
+        ipa_string = ipa_string.replace(old, new)
+
+    # Remove stress marks for primary normalization
+    normalized = _RE_STRESS.sub('', ipa_string)
+
+    return normalized
+
+
+def _score_dialects(ipa_string, features):
+    """
+    Score each known dialect against a pronunciation.
+
+    Args:
+        ipa_string (str): IPA pronunciation string
+        features (dict): Filled in with the features detected along the way
+
+    Yields:
+        tuple: (dialect, match score) for every dialect scoring above 0
+    """
+    # Skip processing if no IPA string
+    if not ipa_string:
+        return
+
+    # Check for rhoticity (r-pronunciation)
+    rhotic = has_rhotic_r(ipa_string)
+    features['rhoticity'] = rhotic
+
+    # Check dialect-specific patterns
+    for dialect, properties in _DIALECT_PATTERNS_COMPILED.items():
+        dialect_match_score = 0
+
+        # Check rhoticity consistency
+        if properties['rhoticity'] == rhotic:
+            dialect_match_score += 1
+
+        # Check pronunciation patterns
+        # Every expected option present adds to the score
+        for compiled, feature, expected_options in properties['patterns']:
+            if compiled.search(ipa_string):
+                hits = sum(option in ipa_string for option in expected_options)
+                if hits:
+                    dialect_match_score += hits
+                    features[feature] = True
+
+        if dialect_match_score > 0:
+            yield dialect, dialect_match_score
+
+
+@lru_cache(maxsize=8192)
+def _top_dialect(ipa_string):
+    """
+    Find the most likely dialect of a pronunciation.
+
+    Backs PhoneticsAgent.detect_top_dialect. The features mapping is returned
+    read-only, since cached results are shared between callers.
+    """
+    features = {}
+    best_dialect = None
+    best_score = 0
+
+    for dialect, score in _score_dialects(ipa_string, features):
+        # Confidence saturates at a score of 5; ties go to the first dialect
+        score = min(score, 5)
+        if score > best_score:
+            best_dialect, best_score = dialect, score
+
+    return best_dialect, best_score / 5, MappingProxyType(features)
+
 
 class PhoneticsAgent:
     """
@@ -86,6 +247,9 @@ class PhoneticsAgent:
     4. Phonological pattern extraction
     """
     
+    # Whether the audio_files directory has been created in this process
+    _audio_dir_ready = False
+    
     def __init__(self, db_config=None):
         """
         Initialize the phonetics agent.
@@ -96,6 +260,21 @@ class PhoneticsAgent:
         self.db_config = db_config or get_connection_dict()
         self.conn = None
         self.cursor = None
+        # Set while used as a context manager, so methods share one connection
+        self._hold_connection = False
+    
+    def __enter__(self):
+        """Open one connection to be shared by every method until exit."""
+        self._hold_connection = True
+        self.connect_to_db()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the shared connection."""
+        self._hold_connection = False
+        if self.conn is not None:
+            self.close_connection()
+        return False
     
     def connect_to_db(self):
         """Establish a connection to the database."""
@@ -116,6 +295,17 @@ class PhoneticsAgent:
             self.conn.close()
         logger.info("Database connection closed")
     
+    def _acquire_connection(self):
+        """Reuse the connection held by the context manager, or open a new one."""
+        if self._hold_connection and self.conn is not None and not self.conn.closed:
+            return True
+        return self.connect_to_db()
+    
+    def _release_connection(self):
+        """Close the connection unless the context manager is holding it."""
+        if not self._hold_connection:
+            self.close_connection()
+    
     def normalize_ipa(self, ipa_string):
         """
         Normalize IPA pronunciation by applying standard conventions.
@@ -126,20 +316,7 @@ class PhoneticsAgent:
         Returns:
             str: Normalized IPA string
         """
-        if not ipa_string:
-            return None
-            
-        # Remove enclosing slashes or brackets if present
-        ipa_string = re.sub(r'^[/\[\(]|[/\]\)]$', '', ipa_string)
-        
-        # Apply normalization mappings
-        for old, new in IPA_NORMALIZATION.items():
-            ipa_string = ipa_string.replace(old, new)
-        
-        # Remove stress marks for primary normalization
-        normalized = re.sub(r'[ˈˌ]', '', ipa_string)
-        
-        return normalized
+        return _normalize_ipa(ipa_string)
     
     def detect_dialect_features(self, ipa_string, language='en'):
         """
@@ -157,43 +334,33 @@ class PhoneticsAgent:
             'features': {}
         }
         
-        # Skip processing if no IPA string
-        if not ipa_string:
-            return results
-            
-        # Check for rhoticity (r-pronunciation)
-        has_rhotic_r = bool(re.search(r'[ɹɻrɾ]($|[^aeiouəɑɛɪɔʊʌæɒ])', ipa_string))
-        results['features']['rhoticity'] = has_rhotic_r
-        
-        # Check dialect-specific patterns
-        for dialect, properties in DIALECT_PATTERNS.items():
-            dialect_match_score = 0
-            
-            # Check rhoticity consistency
-            if properties['rhoticity'] == has_rhotic_r:
-                dialect_match_score += 1
-            
-            # Check pronunciation patterns
-            for pattern, expected in properties['patterns'].items():
-                if re.search(pattern, ipa_string):
-                    expected_options = expected.split('|')
-                    for option in expected_options:
-                        if option in ipa_string:
-                            dialect_match_score += 1
-                            results['features'][f"{dialect}_{pattern}"] = True
-            
-            if dialect_match_score > 0:
-                results['likely_dialects'].append({
-                    'dialect': dialect,
-                    'confidence': min(dialect_match_score / 5, 1.0)  # Scale to 0-1
-                })
+        for dialect, score in _score_dialects(ipa_string, results['features']):
+            results['likely_dialects'].append({
+                'dialect': dialect,
+                'confidence': min(score / 5, 1.0)  # Scale to 0-1
+            })
         
         # Sort dialects by confidence
         results['likely_dialects'].sort(key=lambda x: x['confidence'], reverse=True)
         
         return results
     
-    def process_new_pronunciations(self):
+    def detect_top_dialect(self, ipa_string, language='en'):
+        """
+        Find the most likely dialect of a pronunciation.
+        
+        Cheaper than detect_dialect_features when only the best match is needed.
+        
+        Args:
+            ipa_string (str): IPA pronunciation string
+            language (str): Language code
+            
+        Returns:
+            tuple: (dialect or None, confidence, read-only detected features mapping)
+        """
+        return _top_dialect(ipa_string)
+    
+    def process_new_pronunciations(self, batch_size=100):
         """
         Process new pronunciation entries in the database.
         
@@ -201,10 +368,31 @@ class PhoneticsAgent:
         1. Normalizing IPA notation
         2. Detecting dialect features
         3. Updating pronunciation variants
+        
+        Args:
+            batch_size (int): Maximum number of entries to process
+            
+        Returns:
+            int: Number of entries processed (0 if none were left or on error)
         """
-        if not self.connect_to_db():
-            return False
+        if not self._acquire_connection():
+            return 0
+        
+        try:
+            return self._process_batch(batch_size)
+        finally:
+            self._release_connection()
+    
+    def _process_batch(self, batch_size):
+        """
+        Process one batch of new pronunciation entries on the open connection.
         
+        Args:
+            batch_size (int): Maximum number of entries to process
+            
+        Returns:
+            int: Number of entries processed (0 if none were left or on error)
+        """
         try:
             # Find phonetics entries that haven't been processed
             self.cursor.execute("""
@@ -216,12 +404,27 @@ class PhoneticsAgent:
                 LEFT JOIN dialects d ON p.dialect_id = d.dialect_id
                 WHERE p.pronunciation_variant IS NULL
                   OR p.notes IS NULL
-                LIMIT 100
-            """)
+                LIMIT %s
+            """, (batch_size,))
             
             entries = self.cursor.fetchall()
             logger.info(f"Found {len(entries)} pronunciation entries to process")
             
+            # Look up the dialects of every language in the batch up front
+            self.cursor.execute("""
+                SELECT d.dialect_id, d.dialect_name, l.language_code
+                FROM dialects d
+                JOIN languages l ON d.language_id = l.language_id
+                WHERE l.language_code = ANY(%s)
+            """, (list({entry['language_code'] for entry in entries}),))
+            dialect_ids = {
+                (row['dialect_name'], row['language_code']): row['dialect_id']
+                for row in self.cursor.fetchall()
+            }
+            
+            # (phonetic_id, ipa, variant, notes, dialect_id) rows for one batched UPDATE
+            updates = []
+            
             for entry in entries:
                 phonetic_id = entry['phonetic_id']
                 word_id = entry['word_id']
@@ -233,36 +436,21 @@ class PhoneticsAgent:
                 # Normalize IPA
                 normalized_ipa = self.normalize_ipa(ipa)
                 
-                # Detect dialect features
-                dialect_features = self.detect_dialect_features(normalized_ipa, language_code)
+                # Detect the most likely dialect
+                top_dialect, confidence, features = self.detect_top_dialect(normalized_ipa, language_code)
                 
                 # Determine pronunciation variant
                 variant = "standard"
-                if dialect_features['likely_dialects']:
-                    top_dialect = dialect_features['likely_dialects'][0]
-                    if top_dialect['confidence'] > 0.7 and not dialect_name:
-                        variant = f"{top_dialect['dialect'].lower()}"
-                        
-                        # Try to find or create appropriate dialect_id
-                        self.cursor.execute("""
-                            SELECT dialect_id FROM dialects 
-                            WHERE dialect_name = %s AND language_id = 
-                                (SELECT language_id FROM languages WHERE language_code = %s)
-                        """, (top_dialect['dialect'], language_code))
-                        
-                        dialect_result = self.cursor.fetchone()
-                        dialect_id = dialect_result['dialect_id'] if dialect_result else None
-                        
-                        if dialect_id:
-                            # Update the dialect_id
-                            self.cursor.execute("""
-                                UPDATE phonetics SET dialect_id = %s
-                                WHERE phonetic_id = %s
-                            """, (dialect_id, phonetic_id))
+                dialect_id = None
+                if top_dialect and confidence > 0.7 and not dialect_name:
+                    variant = top_dialect.lower()
+                    
+                    # Assign the matching dialect_id, if the dialect exists
+                    dialect_id = dialect_ids.get((top_dialect, language_code))
                 
                 # Generate notes
                 features_notes = []
-                for feature, value in dialect_features['features'].items():
+                for feature, value in features.items():
                     if value and not feature.startswith(('American_', 'British_', 'Australian_')):
                         features_notes.append(f"{feature}: {value}")
                 
@@ -270,29 +458,30 @@ class PhoneticsAgent:
                 if features_notes:
                     notes += "Features: " + ", ".join(features_notes)
                 
-                # Update the database
-                self.cursor.execute("""
-                    UPDATE phonetics 
-                    SET ipa_pronunciation = %s,
-                        pronunciation_variant = %s,
-                        notes = %s
-                    WHERE phonetic_id = %s
-                """, (normalized_ipa, variant, notes, phonetic_id))
-                
-                logger.info(f"Processed pronunciation for '{word_text}' (ID: {phonetic_id})")
+                updates.append((phonetic_id, normalized_ipa, variant, notes, dialect_id))
+                logger.debug(f"Processed pronunciation for '{word_text}' (ID: {phonetic_id})")
+            
+            # Update the database in one statement; rows without a detected
+            # dialect keep their current dialect_id
+            execute_values(self.cursor, """
+                UPDATE phonetics AS p
+                SET ipa_pronunciation = v.ipa,
+                    pronunciation_variant = v.variant,
+                    notes = v.notes,
+                    dialect_id = COALESCE(v.dialect_id, p.dialect_id)
+                FROM (VALUES %s) AS v(phonetic_id, ipa, variant, notes, dialect_id)
+                WHERE p.phonetic_id = v.phonetic_id
+            """, updates, template="(%s, %s, %s, %s, %s::integer)", page_size=500)
             
             # Commit changes
             self.conn.commit()
             logger.info(f"Successfully processed {len(entries)} pronunciation entries")
-            return True
+            return len(entries)
             
         except Exception as e:
             self.conn.rollback()
             logger.error(f"Error processing pronunciations: {e}")
-            return False
-        
-        finally:
-            self.close_connection()
+            return 0
     
     def analyze_language_phonology(self, language_code):
         """
@@ -304,65 +493,59 @@ class PhoneticsAgent:
         Returns:
             dict: Phonological analysis results
         """
-        if not self.connect_to_db():
+        if not self._acquire_connection():
             return None
         
         try:
-            # Find all pronunciations for the language
-            self.cursor.execute("""
-                SELECT p.ipa_pronunciation, w.word_text
-                FROM phonetics p
-                JOIN words w ON p.word_id = w.word_id
-                JOIN languages l ON w.language_id = l.language_id
-                WHERE l.language_code = %s
-                  AND p.is_primary = TRUE
-                LIMIT 1000
-            """, (language_code,))
-            
-            pronunciations = self.cursor.fetchall()
-            if not pronunciations:
-                logger.warning(f"No pronunciations found for language {language_code}")
-                return None
-            
-            # Analyze phonological patterns
             analysis = {
                 'language_code': language_code,
-                'sample_size': len(pronunciations),
+                'sample_size': 0,
                 'phoneme_inventory': set(),
-                'consonant_clusters': {},
-                'syllable_patterns': {},
+                'consonant_clusters': Counter(),
+                'syllable_patterns': Counter(),
                 'timestamp': datetime.now().isoformat()
             }
             
-            # Extract phonemes and patterns
-            for p in pronunciations:
-                ipa = p['ipa_pronunciation']
-                word = p['word_text']
-                
-                # Extract phonemes (simplified approach)
-                phonemes = re.findall(r'[^\s\-\.]+', ipa)
-                for phoneme in phonemes:
-                    analysis['phoneme_inventory'].add(phoneme)
+            # Stream the language's pronunciations through a server-side cursor,
+            # so rows are fetched in chunks while earlier ones are analyzed
+            with self.conn.cursor(name='phonology_stream') as cursor:
+                cursor.itersize = 2000
+                cursor.execute("""
+                    SELECT p.ipa_pronunciation, w.word_text <> '' AS has_word
+                    FROM phonetics p
+                    JOIN words w ON p.word_id = w.word_id
+                    JOIN languages l ON w.language_id = l.language_id
+                    WHERE l.language_code = %s
+                      AND p.is_primary = TRUE
+                    LIMIT 1000
+                """, (language_code,))
                 
-                # Identify consonant clusters (simplified)
-                consonant_pattern = r'[bcdfghjklmnpqrstvwxyzðθʃʒŋɹɾɻ]{2,}'
-                clusters = re.findall(consonant_pattern, ipa, re.IGNORECASE)
-                for cluster in clusters:
-                    analysis['consonant_clusters'][cluster] = analysis['consonant_clusters'].get(cluster, 0) + 1
-                
-                # Identify syllable patterns (very simplified)
-                if len(word) > 0:
-                    syllable_count = max(1, len(re.findall(r'[aeiouæɑɛɪɔʊʌəɒ]+', ipa, re.IGNORECASE)))
-                    key = f"{syllable_count}_syllable"
-                    analysis['syllable_patterns'][key] = analysis['syllable_patterns'].get(key, 0) + 1
+                # Extract phonemes and patterns from the plain tuple rows
+                for ipa, has_word in cursor:
+                    analysis['sample_size'] += 1
+                    
+                    # Extract phonemes (simplified approach)
+                    analysis['phoneme_inventory'].update(_RE_PHONEMES.findall(ipa))
+                    
+                    # Identify consonant clusters (simplified)
+                    analysis['consonant_clusters'].update(_RE_CLUSTERS.findall(ipa))
+                    
+                    # Identify syllable patterns (very simplified)
+                    if has_word:
+                        syllable_count = max(1, count_vowel_runs(ipa))
+                        key = f"{syllable_count}_syllable"
+                        analysis['syllable_patterns'][key] += 1
+            
+            if not analysis['sample_size']:
+                logger.warning(f"No pronunciations found for language {language_code}")
+                return None
             
             # Convert phoneme inventory to list for JSON serialization
             analysis['phoneme_inventory'] = list(analysis['phoneme_inventory'])
             
-            # Sort consonant clusters by frequency
-            analysis['consonant_clusters'] = dict(
-                sorted(analysis['consonant_clusters'].items(), key=lambda x: x[1], reverse=True)[:20]
-            )
+            # Keep the 20 most frequent consonant clusters
+            analysis['consonant_clusters'] = dict(analysis['consonant_clusters'].most_common(20))
+            analysis['syllable_patterns'] = dict(analysis['syllable_patterns'])
             
             return analysis
             
@@ -371,7 +554,7 @@ class PhoneticsAgent:
             return None
         
         finally:
-            self.close_connection()
+            self._release_connection()
     
     def generate_audio_placeholder(self, word_id):
         """
@@ -385,8 +568,10 @@ class PhoneticsAgent:
         Returns:
             str: Path to the generated audio file (placeholder)
         """
-        audio_dir = Path('audio_files')
-        audio_dir.mkdir(exist_ok=True)
+        # Create the audio directory on the first call only
+        if not PhoneticsAgent._audio_dir_ready:
+            Path('audio_files').mkdir(exist_ok=True)
+            PhoneticsAgent._audio_dir_ready = True
         
         # In a real implementation, generate actual audio
         # For now, just return a placeholder path
@@ -396,63 +581,47 @@ class PhoneticsAgent:
         """
         Run a batch processing job on unprocessed phonetics data.
         
+        Batches are processed until one comes back empty, so the unprocessed
+        entries never need to be counted up front.
+        
         Args:
             batch_size (int): Number of entries to process in one batch
             
         Returns:
             int: Number of entries processed
         """
-        if not self.connect_to_db():
+        if not self._acquire_connection():
             return 0
         
+        processed_count = 0
+        
         try:
-            # Get count of unprocessed entries
-            self.cursor.execute("""
-                SELECT COUNT(*) as count
-                FROM phonetics
-                WHERE pronunciation_variant IS NULL
-                   OR notes IS NULL
-            """)
-            
-            result = self.cursor.fetchone()
-            total_unprocessed = result['count'] if result else 0
-            
-            if total_unprocessed == 0:
-                logger.info("No unprocessed phonetics entries found")
-                return 0
-            
-            # Process in batches
-            processed_count = 0
-            batch_count = min(batch_size, total_unprocessed)
-            
-            for _ in range(0, total_unprocessed, batch_size):
-                if self.process_new_pronunciations():
-                    processed_count += batch_count
-                
-                if processed_count >= total_unprocessed:
+            # Reuse one connection for every batch
+            while True:
+                batch_processed = self._process_batch(batch_size)
+                if not batch_processed:
                     break
-            
-            logger.info(f"Batch processing complete. Processed {processed_count} entries.")
-            return processed_count
-            
-        except Exception as e:
-            logger.error(f"Error in batch processing: {e}")
-            return 0
-        
+                processed_count += batch_processed
         finally:
-            self.close_connection()
+            self._release_connection()
+        
+        if processed_count == 0:
+            logger.info("No unprocessed phonetics entries found")
+        
+        logger.info(f"Batch processing complete. Processed {processed_count} entries.")
+        return processed_count
 
 
 def main():
     """Main entry point for running the phonetics agent."""
-    agent = PhoneticsAgent()
-    
-    # Process any unprocessed pronunciation entries
-    processed_count = agent.run_batch_processing()
-    print(f"Processed {processed_count} pronunciation entries")
+    with PhoneticsAgent() as agent:
+        # Process any unprocessed pronunciation entries
+        processed_count = agent.run_batch_processing()
+        print(f"Processed {processed_count} pronunciation entries")
+        
+        # Analyze phonology for English
+        en_analysis = agent.analyze_language_phonology('en')
     
-    # Analyze phonology for English
-    en_analysis = agent.analyze_language_phonology('en')
     if en_analysis:
         # In a real implementation, we would store this in the database
         # For now, just print a summary
@@ -5,20 +5,58 @@ This module contains utility functions that are used across the system.
 """
 import os
 import re
+import csv
 import json
 import time
 import hashlib
 import logging
+import itertools
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-import pandas as pd
-import psycopg2
 from psycopg2.extras import DictCursor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import local modules
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from database.db_config import get_connection_dict
+try:
+    from database.db_config import get_pool
+except ImportError:
+    # Run as a script, without legacy/ on the import path
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from database.db_config import get_pool
+
+# Precompiled patterns for normalize_text and is_valid_language_code
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+# The ASCII characters _PUNCT_RE removes, deleted with str.translate for ASCII text
+_ASCII_PUNCT_TABLE = str.maketrans('', '', ''.join(c for c in map(chr, range(128)) if _PUNCT_RE.match(c)))
+# ISO 639-1 (2 letters), ISO 639-3 (3 letters) or language-region (e.g., en-US, pt-BR)
+_LANGUAGE_CODE_RE = re.compile(r'^(?:[a-z]{2}(?:-[A-Z]{2})?|[a-z]{3})$')
+
+# Rows fetched per round trip when streaming exports
+EXPORT_ITERSIZE = 10000
+
+# Common language codes
+LANGUAGE_NAMES = {
+    'en': 'English',
+    'es': 'Spanish',
+    'fr': 'French',
+    'de': 'German',
+    'it': 'Italian',
+    'pt': 'Portuguese',
+    'ru': 'Russian',
+    'zh': 'Chinese',
+    'ja': 'Japanese',
+    'ko': 'Korean',
+    'ar': 'Arabic',
+    'hi': 'Hindi',
+    # Add more as needed
+}
 
 
 def setup_logger(name, log_file=None, level=logging.INFO):
@@ -59,7 +97,7 @@ def setup_logger(name, log_file=None, level=logging.INFO):
 
 def get_database_connection(db_config=None):
     """
-    Get a connection to the database.
+    Borrow a connection from the shared pool.
     
     Args:
         db_config (dict): Database connection parameters
@@ -68,11 +106,8 @@ def get_database_connection(db_config=None):
         tuple: (Connection, Cursor) or (None, None) on error
     """
     try:
-        # Get configuration
-        config = db_config or get_connection_dict()
-        
-        # Connect to database
-        conn = psycopg2.connect(**config)
+        # Borrow a pooled connection
+        conn = get_pool(db_config).getconn()
         cursor = conn.cursor(cursor_factory=DictCursor)
         
         return conn, cursor
@@ -81,6 +116,20 @@ def get_database_connection(db_config=None):
         return None, None
 
 
+def release_database_connection(conn, cursor=None, db_config=None):
+    """
+    Return a connection obtained from get_database_connection to the pool.
+    
+    Args:
+        conn: Connection to release
+        cursor: Cursor to close (optional)
+        db_config (dict): Database connection parameters the connection was borrowed with
+    """
+    if cursor is not None:
+        cursor.close()
+    get_pool(db_config).putconn(conn)
+
+
 def execute_query(query, params=None, fetchone=False, db_config=None):
     """
     Execute a database query and return results.
@@ -119,9 +168,8 @@ def execute_query(query, params=None, fetchone=False, db_config=None):
         logging.error(f"Query execution error: {e}")
         return None
     finally:
-        # Close cursor and connection
-        cursor.close()
-        conn.close()
+        # Close cursor and hand the connection back to the pool
+        release_database_connection(conn, cursor, db_config)
 
 
 def compute_hash(text):
@@ -159,18 +207,32 @@ def normalize_text(text, lowercase=True, remove_punctuation=True, remove_whitesp
     
     # Remove punctuation
     if remove_punctuation:
-        text = re.sub(r'[^\w\s]', '', text)
+        if text.isascii():
+            text = text.translate(_ASCII_PUNCT_TABLE)
+        else:
+            text = _PUNCT_RE.sub('', text)
     
     # Remove whitespace
     if remove_whitespace:
-        text = re.sub(r'\s+', '', text)
+        text = _WS_RE.sub('', text)
     else:
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS_RE.sub(' ', text).strip()
     
     return text
 
 
+# Directories already created by _ensure_dir in this process
+_created_dirs = set()
+
+
+def _ensure_dir(directory):
+    """Create a directory (and parents) unless this process already did."""
+    if directory and directory not in _created_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+
+
 def save_json(data, filepath):
     """
     Save data to a JSON file.
@@ -184,7 +246,7 @@ def save_json(data, filepath):
     """
     try:
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        _ensure_dir(os.path.dirname(filepath))
         
         # Save data to file
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -214,6 +276,7 @@ def load_json(filepath):
         return None
 
 
+@lru_cache(maxsize=4096)
 def is_valid_language_code(language_code):
     """
     Check if a language code is valid.
@@ -224,19 +287,8 @@ def is_valid_language_code(language_code):
     Returns:
         bool: Whether the language code is valid
     """
-    # ISO 639-1 language codes are 2 letters
-    if re.match(r'^[a-z]{2}$', language_code):
-        return True
-    
-    # ISO 639-3 language codes are 3 letters
-    if re.match(r'^[a-z]{3}$', language_code):
-        return True
-    
-    # Language-region codes (e.g., en-US, pt-BR)
-    if re.match(r'^[a-z]{2}-[A-Z]{2}$', language_code):
-        return True
-    
-    return False
+    # ISO 639-1, ISO 639-3 or language-region code, in a single match
+    return _LANGUAGE_CODE_RE.match(language_code) is not None
 
 
 def get_language_name(language_code):
@@ -249,33 +301,45 @@ def get_language_name(language_code):
     Returns:
         str: Language name or None if not found
     """
-    # Common language codes
-    language_map = {
-        'en': 'English',
-        'es': 'Spanish',
-        'fr': 'French',
-        'de': 'German',
-        'it': 'Italian',
-        'pt': 'Portuguese',
-        'ru': 'Russian',
-        'zh': 'Chinese',
-        'ja': 'Japanese',
-        'ko': 'Korean',
-        'ar': 'Arabic',
-        'hi': 'Hindi',
-        # Add more as needed
-    }
-    
     # Check the map
-    if language_code in language_map:
-        return language_map[language_code]
+    if language_code in LANGUAGE_NAMES:
+        return LANGUAGE_NAMES[language_code]
     
     # If not in map, check the database
+    try:
+        return _lookup_language_name(language_code)
+    except _QueryFailed:
+        return None
+
+
+class _QueryFailed(Exception):
+    """Raised by cached lookups when the query fails, so the failure is not cached."""
+
+
+@lru_cache(maxsize=1024)
+def _lookup_language_name(language_code):
+    """
+    Look up a language name in the database.
+    
+    The languages table does not change during a run, so each code is
+    queried at most once per process. Failed queries raise _QueryFailed
+    instead of being cached, and are retried on the next call.
+    
+    Args:
+        language_code (str): Language code
+        
+    Returns:
+        str: Language name or None if not found
+    """
     query = "SELECT language_name FROM languages WHERE language_code = %s"
-    result = execute_query(query, (language_code,), fetchone=True)
+    # fetchall tells "not found" ([]) apart from a failed query (None)
+    rows = execute_query(query, (language_code,))
+    
+    if rows is None:
+        raise _QueryFailed(language_code)
     
-    if result:
-        return result['language_name']
+    if rows:
+        return rows[0]['language_name']
     
     return None
 
@@ -316,6 +380,9 @@ def generate_export_file(query, params=None, output_path=None, format='csv'):
     """
     Generate an export file from a database query.
     
+    CSV and JSON exports stream rows from a server-side cursor straight to the
+    file; Excel exports are built in memory with pandas.
+    
     Args:
         query (str): SQL query to execute
         params (tuple): Query parameters
@@ -325,36 +392,92 @@ def generate_export_file(query, params=None, output_path=None, format='csv'):
     Returns:
         str: Path to the export file or None on error
     """
-    # Execute query
-    results = execute_query(query, params)
-    
-    if not results:
+    if format not in ('csv', 'json', 'excel'):
+        logging.error(f"Unsupported export format: {format}")
         return None
     
-    # Convert to DataFrame
-    df = pd.DataFrame(results)
-    
     # Generate default output path if not provided
     if not output_path:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"export_{timestamp}.{format}"
         output_path = os.path.join('exports', filename)
     
-    # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    if format == 'excel':
+        return _generate_excel_export(query, params, output_path)
     
-    # Export based on format
+    pool = get_pool()
     try:
-        if format == 'csv':
-            df.to_csv(output_path, index=False, encoding='utf-8')
-        elif format == 'json':
-            df.to_json(output_path, orient='records', force_ascii=False, indent=2)
-        elif format == 'excel':
-            df.to_excel(output_path, index=False)
-        else:
-            logging.error(f"Unsupported export format: {format}")
-            return None
+        conn = pool.getconn()
+    except Exception as e:
+        logging.error(f"Database connection error: {e}")
+        return None
+    
+    tmp_path = None
+    try:
+        with conn.cursor(name='export_stream') as cursor:
+            cursor.itersize = EXPORT_ITERSIZE
+            cursor.execute(query, params or ())
+            
+            # Nothing to export, as before
+            first = cursor.fetchone()
+            if first is None:
+                return None
+            columns = [column.name for column in cursor.description]
+            
+            # Create directory if it doesn't exist
+            _ensure_dir(os.path.dirname(output_path))
+            
+            # Stream into a temporary file and move it into place once complete,
+            # so a failure partway through never leaves a truncated export
+            tmp_path = f"{output_path}.part"
+            rows = itertools.chain((first,), cursor)
+            if format == 'csv':
+                with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(columns)
+                    writer.writerows(rows)
+            else:
+                with open(tmp_path, 'wb') as f:
+                    f.write(b'[\n')
+                    for i, row in enumerate(rows):
+                        if i:
+                            f.write(b',\n')
+                        f.write(_json_record(dict(zip(columns, row))))
+                    f.write(b'\n]\n')
+            os.replace(tmp_path, output_path)
         
+        return output_path
+    except Exception as e:
+        logging.error(f"Error generating export file: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return None
+    finally:
+        pool.putconn(conn)
+
+
+def _json_record(record):
+    """Serialize one export record to UTF-8 JSON bytes; decimals and other non-JSON values become text."""
+    if orjson is not None:
+        return orjson.dumps(record, default=str)
+    return json.dumps(record, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _generate_excel_export(query, params, output_path):
+    """Export query results to an Excel file through pandas."""
+    import pandas as pd
+    
+    # Execute query
+    results = execute_query(query, params)
+    
+    if not results:
+        return None
+    
+    # Create directory if it doesn't exist
+    _ensure_dir(os.path.dirname(output_path))
+    
+    try:
+        pd.DataFrame(results).to_excel(output_path, index=False)
         return output_path
     except Exception as e:
         logging.error(f"Error generating export file: {e}")
@@ -384,10 +507,40 @@ def word_exists(word_text, language_code):
     return result is not None
 
 
+def words_exist(word_language_pairs):
+    """
+    Check which of many words exist in the database, in a single query.
+    
+    Args:
+        word_language_pairs (iterable): (word_text, language_code) pairs to check
+    
+    Returns:
+        set: The (word_text, language_code) pairs that exist
+    """
+    pairs = set(word_language_pairs)
+    if not pairs:
+        return set()
+    
+    words, language_codes = zip(*pairs)
+    query = """
+        SELECT w.word_text, l.language_code
+        FROM unnest(%s::text[], %s::text[]) AS q(word_text, language_code)
+        JOIN languages l ON l.language_code = q.language_code
+        JOIN words w ON w.language_id = l.language_id AND w.word_text = q.word_text
+    """
+    
+    results = execute_query(query, (list(words), list(language_codes)))
+    
+    return {(row['word_text'], row['language_code']) for row in results or ()}
+
+
 def get_word_info(word_text, language_code):
     """
     Get information about a word.
     
+    The definitions, pronunciations and examples are aggregated into JSON
+    arrays by the database, so everything comes back in one query.
+    
     Args:
         word_text (str): Word to get info for
         language_code (str): Language code
@@ -398,55 +551,49 @@ def get_word_info(word_text, language_code):
     query = """
         SELECT w.word_id, w.word_text, w.frequency_rank, w.sentence_construction_importance,
                w.conversational_utility_score, w.part_of_speech, w.etymology,
-               l.language_code, l.language_name
+               l.language_code, l.language_name,
+               -- Definitions
+               COALESCE((
+                   SELECT json_agg(d ORDER BY d.definition_order)
+                   FROM (
+                       SELECT definition_id, definition_text, context, domain, definition_order, is_primary
+                       FROM definitions
+                       WHERE word_id = w.word_id
+                   ) d
+               ), '[]') AS definitions,
+               -- Pronunciations
+               COALESCE((
+                   SELECT json_agg(p)
+                   FROM (
+                       SELECT p.phonetic_id, p.ipa_pronunciation, p.pronunciation_variant, p.is_primary,
+                              d.dialect_name
+                       FROM phonetics p
+                       LEFT JOIN dialects d ON p.dialect_id = d.dialect_id
+                       WHERE p.word_id = w.word_id
+                   ) p
+               ), '[]') AS pronunciations,
+               -- Example sentences
+               COALESCE((
+                   SELECT json_agg(es)
+                   FROM (
+                       SELECT es.sentence_id, es.sentence_text, es.complexity_score, es.tone, es.context
+                       FROM example_sentences es
+                       JOIN word_sentence_map wsm ON es.sentence_id = wsm.sentence_id
+                       WHERE wsm.word_id = w.word_id
+                   ) es
+               ), '[]') AS examples
         FROM words w
         JOIN languages l ON w.language_id = l.language_id
         WHERE w.word_text = %s AND l.language_code = %s
     """
     
+    # psycopg2 decodes the json columns into lists of dicts
     word_info = execute_query(query, (word_text, language_code), fetchone=True)
     
     if not word_info:
         return None
     
-    # Get definitions
-    definitions_query = """
-        SELECT definition_id, definition_text, context, domain, definition_order, is_primary
-        FROM definitions
-        WHERE word_id = %s
-        ORDER BY definition_order
-    """
-    
-    definitions = execute_query(definitions_query, (word_info['word_id'],))
-    
-    # Get pronunciations
-    pronunciations_query = """
-        SELECT p.phonetic_id, p.ipa_pronunciation, p.pronunciation_variant, p.is_primary,
-               d.dialect_name
-        FROM phonetics p
-        LEFT JOIN dialects d ON p.dialect_id = d.dialect_id
-        WHERE p.word_id = %s
-    """
-    
-    pronunciations = execute_query(pronunciations_query, (word_info['word_id'],))
-    
-    # Get example sentences
-    examples_query = """
-        SELECT es.sentence_id, es.sentence_text, es.complexity_score, es.tone, es.context
-        FROM example_sentences es
-        JOIN word_sentence_map wsm ON es.sentence_id = wsm.sentence_id
-        WHERE wsm.word_id = %s
-    """
-    
-    examples = execute_query(examples_query, (word_info['word_id'],))
-    
-    # Combine all information
-    result = dict(word_info)
-    result['definitions'] = definitions or []
-    result['pronunciations'] = pronunciations or []
-    result['examples'] = examples or []
-    
-    return result
+    return dict(word_info)
 
 
 if __name__ == "__main__":
@@ -458,8 +605,7 @@ if __name__ == "__main__":
     conn, cursor = get_database_connection()
     if conn and cursor:
         logger.info("Database connection successful")
-        cursor.close()
-        conn.close()
+        release_database_connection(conn, cursor)
     else:
         logger.error("Database connection failed")
         
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, validator, model_validator
-from typing import List, Optional, Dict, Literal
+from pydantic import BaseModel, Field, StringConstraints, field_validator, model_validator
+from typing import Annotated, List, Optional, Dict, Literal
 from datetime import datetime
 
 class G2PRule(BaseModel):
@@ -29,7 +29,8 @@ class LanguageProfileV1(BaseModel):
     language: str
     dialect: str
     script: str
-    version: str = "1.0.0"
+    # semver, checked by pydantic-core's compiled regex
+    version: Annotated[str, StringConstraints(pattern=r"^\d+\.\d+\.\d+$")] = "1.0.0"
     updated_at: Optional[datetime] = None
     phoneme_inventory: List[str]
     g2p_rules: List[G2PRule] = []
@@ -43,13 +44,8 @@ class LanguageProfileV1(BaseModel):
     curation_targets: CurationTargets = CurationTargets()
     tts_strategy: Literal["standalone","grouped","cloud_fallback"] = "standalone"
 
-    @validator("version")
-    def semver(cls, v):
-        import re
-        assert re.match(r"^\d+\.\d+\.\d+$", v), "version must be semver"
-        return v
-
-    @validator("register_defaults")
+    @field_validator("register_defaults")
+    @classmethod
     def probs_sum_to_one(cls, v):
         s = sum(v.values())
         assert abs(s - 1.0) < 1e-6, "register_defaults must sum to 1.0"
@@ -0,0 +1,23 @@
+// Compile JSON schemas to TypeScript in a single Node process.
+// Usage: node generate-types.mjs <output-dir> <schema.json>...
+// Prints the name of each schema it generated; failures go to stderr.
+import { writeFile } from 'node:fs/promises';
+import { basename, join } from 'node:path';
+import jsonSchemaToTypescript from 'json-schema-to-typescript';
+
+const { compileFromFile } = jsonSchemaToTypescript;
+const [outputDir, ...schemaFiles] = process.argv.slice(2);
+
+let failed = 0;
+for (const schemaFile of schemaFiles) {
+  const name = basename(schemaFile, '.json');
+  try {
+    const ts = await compileFromFile(schemaFile);
+    await writeFile(join(outputDir, `${name}.ts`), ts);
+    console.log(name);
+  } catch (err) {
+    console.error(`${schemaFile}: ${err.message}`);
+    failed += 1;
+  }
+}
+process.exitCode = failed ? 1 : 0;
@@ -1,30 +1,59 @@
-import csv, json, os
+import json, os
 from typing import List, Dict, Optional
 from .lints import lint_tts_manifest, LintIssue, LintReport
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
+MANIFEST_WRITE_CHUNK = 1000
+
+def _json_bytes(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+# characters that make csv.writer quote a field in the "|"-delimited metadata.csv
+_QUOTED_CHARS = frozenset('"|\r\n')
+
+def _metadata_field(value) -> str:
+    """Quote a metadata.csv field the way csv.writer(delimiter="|") does."""
+    if value is None:
+        return ""
+    s = str(value)
+    if not _QUOTED_CHARS.isdisjoint(s):
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
 def build_metadata_csv(out_dir: str, manifest_rows: List[Dict], use_phonemes: bool = False):
     os.makedirs(os.path.join(out_dir, "clips"), exist_ok=True)
     csv_path = os.path.join(out_dir, "metadata.csv")
+    textkey = "phonemes" if use_phonemes else "text"
+    # path should be relative like "clips/uuid.wav"; rows end in \r\n, the csv module default
+    lines = "".join(
+        f"{_metadata_field(r['wav'])}|{_metadata_field(r.get(textkey, ''))}|"
+        f"{_metadata_field(r.get('speaker_id', 'spk_unknown'))}\r\n"
+        for r in manifest_rows
+    )
     with open(csv_path, "w", encoding="utf-8", newline="") as f:
-        w = csv.writer(f, delimiter="|")
-        for r in manifest_rows:
-            path = r["wav"]  # should be relative like "clips/uuid.wav"
-            textfield = r.get("phonemes") if use_phonemes else r.get("text", "")
-            spk = r.get("speaker_id", "spk_unknown")
-            w.writerow([path, textfield, spk])
+        f.write(lines)
     return csv_path
 
 def write_manifest_jsonl(out_dir: str, manifest_rows: List[Dict]):
     path = os.path.join(out_dir, "manifest.jsonl")
-    with open(path, "w", encoding="utf-8") as f:
-        for r in manifest_rows:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+    with open(path, "wb") as f:
+        # one write per chunk of rows; small chunks keep the joined payload cheap to allocate
+        for i in range(0, len(manifest_rows), MANIFEST_WRITE_CHUNK):
+            chunk = manifest_rows[i:i + MANIFEST_WRITE_CHUNK]
+            f.write(b"\n".join(_json_bytes(r) for r in chunk) + b"\n")
     return path
 
 def write_dataset_card(out_dir: str, stats: Dict):
     path = os.path.join(out_dir, "dataset_card.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(stats, f, ensure_ascii=False, indent=2)
+    with open(path, "wb") as f:
+        f.write(_json_bytes(stats, indent=True))
     return path
 
 def build_tts_snapshot(out_dir: str, manifest_rows: List[Dict], use_phonemes: bool=False):
@@ -34,11 +63,11 @@ def build_tts_snapshot(out_dir: str, manifest_rows: List[Dict], use_phonemes: bo
         raise SystemExit(f"Dataset lints failed:\n{msgs}")
     mpath = write_manifest_jsonl(out_dir, manifest_rows)
     cpath = build_metadata_csv(out_dir, manifest_rows, use_phonemes=use_phonemes)
-    # minimal stats
+    # minimal stats, gathered by the lint pass
     stats = {
         "clips": len(manifest_rows),
-        "sample_rate": list({r["sample_rate"] for r in manifest_rows}),
-        "minutes": sum(float(r["duration_s"]) for r in manifest_rows)/60.0
+        "sample_rate": list(lint.sample_rates),
+        "minutes": lint.total_duration_s/60.0
     }
     dpath = write_dataset_card(out_dir, stats)
     return {"manifest": mpath, "metadata_csv": cpath, "dataset_card": dpath}
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple
+from typing import List, Dict, Set, Tuple
 
 @dataclass
 class LintIssue:
@@ -10,18 +10,24 @@ class LintIssue:
 class LintReport:
     ok: bool
     issues: List[LintIssue] = field(default_factory=list)
+    # manifest stats gathered during the same pass over the rows
+    sample_rates: Set = field(default_factory=set)
+    total_duration_s: float = 0.0
 
 def lint_tts_manifest(rows: List[Dict]) -> LintReport:
     ok = True
     issues = []
     # Checks: single sample rate, duration bounds, non-empty text/phonemes if required
-    srs = {r.get("sample_rate") for r in rows}
-    if len(srs) > 1:
-        ok = False; issues.append(LintIssue("SAMPLE_RATE_MIX","Multiple sample rates detected"))
+    srs = set()
+    total_dur = 0.0
     for r in rows:
+        srs.add(r.get("sample_rate"))
         dur = float(r.get("duration_s", 0))
+        total_dur += dur
         if not (1.5 <= dur <= 14.0):
             ok = False; issues.append(LintIssue("DURATION", f"{r.get('wav')} duration {dur} out of bounds"))
         if not r.get("text") and not r.get("phonemes"):
             ok = False; issues.append(LintIssue("NO_TEXT_OR_PHONEMES", f"{r.get('wav')} missing text/phonemes"))
-    return LintReport(ok=ok, issues=issues)
+    if len(srs) > 1:
+        ok = False; issues.insert(0, LintIssue("SAMPLE_RATE_MIX","Multiple sample rates detected"))
+    return LintReport(ok=ok, issues=issues, sample_rates=srs, total_duration_s=total_dur)
@@ -2,13 +2,18 @@ import argparse, json, os, sys
 from typing import List, Dict
 from mumbl_dataset_builder.build_tts import build_tts_snapshot
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional: falls back to the stdlib json module
+    _json_loads = json.loads
+
 def _load_curated_manifest(path: str) -> List[Dict]:
     rows=[]
-    with open(path,"r",encoding="utf-8") as f:
+    with open(path,"rb") as f:
         for line in f:
-            line=line.strip()
-            if not line: continue
-            rows.append(json.loads(line))
+            # the parser skips surrounding whitespace itself
+            if line.isspace(): continue
+            rows.append(_json_loads(line))
     return rows
 
 def main():
@@ -1,6 +1,11 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # optional: falls back to the stdlib json module
+    from json import loads as json_loads
+
 @dataclass
 class ValidationIssue:
     code: str
@@ -5,8 +5,9 @@ def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--clips_dir", required=True)
     ap.add_argument("--csv", required=True)
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
     args = ap.parse_args()
-    rep = validate_audio_dataset(args.clips_dir, args.csv)
+    rep = validate_audio_dataset(args.clips_dir, args.csv, workers=args.workers)
     if rep.ok:
         print(f"OK: {rep.checked} rows validated")
         sys.exit(0)
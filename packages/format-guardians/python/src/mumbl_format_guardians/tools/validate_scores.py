@@ -5,7 +5,7 @@ def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--path", required=True)
     args = ap.parse_args()
-    with open(args.path, "r", encoding="utf-8") as f:
+    with open(args.path, "rb") as f:
         rep = validate_scores_json(f)
     if rep.ok:
         print(f"OK: {rep.checked} scores validated")
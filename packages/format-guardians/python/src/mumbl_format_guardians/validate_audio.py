@@ -1,44 +1,107 @@
-import csv, wave, contextlib, os
-from mumbl_format_guardians.common import ValidationReport
+import csv, struct, os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+from mumbl_format_guardians.common import ValidationIssue, ValidationReport
 
 TARGET_SR = {22050, 24000}
 MIN_S = 1.5
 MAX_S = 14.0
 
+# below this many rows the worker start-up costs more than it saves
+PARALLEL_MIN_ROWS = 512
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+_RIFF_HEADER = struct.Struct('<4sI4s')
+_CHUNK_HEADER = struct.Struct('<4sI')
+_FMT_CHUNK = struct.Struct('<HHIIHH')
+# WAVE_FORMAT_EXTENSIBLE fmt chunk tail: cbSize, valid bits, channel mask, SubFormat GUID
+_FMT_EXTENSIBLE = struct.Struct('<HHI16s')
+KSDATAFORMAT_SUBTYPE_PCM = b'\x01\x00\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
+
 def _wav_meta(path: str):
-    with contextlib.closing(wave.open(path, 'rb')) as wf:
-        sr = wf.getframerate()
-        ch = wf.getnchannels()
-        nframes = wf.getnframes()
-        dur = nframes / float(sr)
-        sampwidth = wf.getsampwidth()
-        return sr, ch, dur, sampwidth
-
-def validate_audio_dataset(clips_dir: str, csv_path: str) -> ValidationReport:
+    # Walk the RIFF chunk headers up to the data chunk; the samples are never read.
+    with open(path, 'rb') as f:
+        riff, _, wave_id = _RIFF_HEADER.unpack(f.read(12))
+        if riff != b'RIFF' or wave_id != b'WAVE':
+            raise ValueError('not a RIFF/WAVE file')
+        fmt = None
+        subformat = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError('no data chunk')
+            chunk_id, size = _CHUNK_HEADER.unpack(header)
+            if chunk_id == b'data':
+                break
+            if chunk_id == b'fmt ':
+                fmt = _FMT_CHUNK.unpack(f.read(16))
+                size -= 16
+                if fmt[0] == WAVE_FORMAT_EXTENSIBLE and size >= _FMT_EXTENSIBLE.size:
+                    subformat = _FMT_EXTENSIBLE.unpack(f.read(_FMT_EXTENSIBLE.size))[3]
+                    size -= _FMT_EXTENSIBLE.size
+            f.seek(size + (size & 1), 1)  # chunks are padded to even sizes
+    if fmt is None:
+        raise ValueError('data chunk before fmt chunk')
+    tag, ch, sr, _, _, bits = fmt
+    if tag == WAVE_FORMAT_EXTENSIBLE:
+        # extensible is only PCM when its SubFormat says so (float WAVs use it too)
+        if subformat != KSDATAFORMAT_SUBTYPE_PCM:
+            raise ValueError('unknown extensible subformat')
+    elif tag != WAVE_FORMAT_PCM:
+        raise ValueError(f'unknown format: {tag}')
+    sampwidth = (bits + 7) // 8
+    nframes = size // (ch * sampwidth)
+    dur = nframes / float(sr)
+    return sr, ch, dur, sampwidth
+
+def _check_row(clips_dir: str, i: int, row: Dict[str, str]) -> Tuple[List[ValidationIssue], bool]:
+    """Check one CSV row; returns its issues and whether its WAV header could be read."""
+    issues = []
+    rel = row.get("audio_file")
+    if not rel:
+        issues.append(ValidationIssue("CSV_FIELD", "audio_file missing", f"line {i}"))
+        return issues, False
+    wav = os.path.join(clips_dir, os.path.basename(rel))
+    if not os.path.exists(wav):
+        issues.append(ValidationIssue("MISSING_WAV", f"{wav} not found", f"line {i}"))
+        return issues, False
+    try:
+        sr, ch, dur, sw = _wav_meta(wav)
+    except Exception as e:
+        issues.append(ValidationIssue("WAV_READ", f"{wav}: {e}", f"line {i}"))
+        return issues, False
+    if sr not in TARGET_SR:
+        issues.append(ValidationIssue("SR", f"{wav}: sample rate {sr} not in {TARGET_SR}", f"line {i}"))
+    if ch != 1:
+        issues.append(ValidationIssue("CHANNELS", f"{wav}: channels {ch} != 1", f"line {i}"))
+    if not (MIN_S <= dur <= MAX_S):
+        issues.append(ValidationIssue("DURATION", f"{wav}: duration {dur:.2f}s outside [{MIN_S},{MAX_S}]", f"line {i}"))
+    if sw != 2:
+        issues.append(ValidationIssue("BIT_DEPTH", f"{wav}: must be 16-bit PCM (sampwidth=2)", f"line {i}"))
+    return issues, True
+
+def validate_audio_dataset(clips_dir: str, csv_path: str, workers: Optional[int] = None) -> ValidationReport:
+    """Validate every WAV listed in csv_path.
+
+    Rows are checked in worker processes (os.cpu_count() by default) once
+    there are at least PARALLEL_MIN_ROWS of them; workers=1 forces a
+    sequential run. Errors are reported in CSV order either way.
+    """
     rep = ValidationReport(ok=True, checked=0)
     with open(csv_path, newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader, start=2):
-            rel = row.get("audio_file")
-            if not rel:
-                rep.fail("CSV_FIELD", "audio_file missing", path=f"line {i}")
-                continue
-            wav = os.path.join(clips_dir, os.path.basename(rel))
-            if not os.path.exists(wav):
-                rep.fail("MISSING_WAV", f"{wav} not found", path=f"line {i}")
-                continue
-            try:
-                sr, ch, dur, sw = _wav_meta(wav)
-            except Exception as e:
-                rep.fail("WAV_READ", f"{wav}: {e}", path=f"line {i}")
-                continue
-            if sr not in TARGET_SR:
-                rep.fail("SR", f"{wav}: sample rate {sr} not in {TARGET_SR}", path=f"line {i}")
-            if ch != 1:
-                rep.fail("CHANNELS", f"{wav}: channels {ch} != 1", path=f"line {i}")
-            if not (MIN_S <= dur <= MAX_S):
-                rep.fail("DURATION", f"{wav}: duration {dur:.2f}s outside [{MIN_S},{MAX_S}]", path=f"line {i}")
-            if sw != 2:
-                rep.fail("BIT_DEPTH", f"{wav}: must be 16-bit PCM (sampwidth=2)", path=f"line {i}")
-            rep.checked += 1
+        rows = list(csv.DictReader(f))
+    lines = range(2, len(rows) + 2)
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(rows) >= PARALLEL_MIN_ROWS:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(partial(_check_row, clips_dir), lines, rows, chunksize=64))
+    else:
+        results = map(partial(_check_row, clips_dir), lines, rows)
+    for issues, checked in results:
+        for issue in issues:
+            rep.fail(issue.code, issue.message, path=issue.path)
+        rep.checked += checked
     return rep
@@ -1,8 +1,15 @@
 import json, sys
+from functools import lru_cache
 from pydantic import ValidationError
 from mumbl_data_contracts.profiles import LanguageProfileV1
 
 def validate_profile_json_str(s: str):
+    return _validate_cached(s)
+
+# Validation is pure on the input text, so repeat checks of the same profile
+# are memoized. Failures raise and are never cached.
+@lru_cache(maxsize=256)
+def _validate_cached(s: str):
     obj = json.loads(s)
     LanguageProfileV1(**obj)
     return True
@@ -1,15 +1,14 @@
-import json
-from mumbl_format_guardians.common import ValidationReport
+from mumbl_format_guardians.common import ValidationReport, json_loads
 
 FIELDS = ["clarity","alignment","diarization","transcript_accuracy","validity","shape","total"]
 
 def validate_scores_json(lines):
     rep = ValidationReport(ok=True, checked=0)
     for i, line in enumerate(lines, start=1):
-        line=line.strip()
-        if not line: continue
+        # lines may be str or bytes; the parser skips surrounding whitespace itself
+        if not line or line.isspace(): continue
         try:
-            obj = json.loads(line)
+            obj = json_loads(line)
         except Exception as e:
             rep.fail("JSON", f"Line {i}: {e}", path=f"[{i}]"); continue
         for k in FIELDS:
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from typing import List, Optional, Dict
 
 class BatchInput(BaseModel):
@@ -14,3 +14,28 @@ class BatchManifest(BaseModel):
     outputs: Dict[str, str] = {}
     metrics: Dict[str, float] = {}
     status: str = "created"
+
+    @field_validator("inputs")
+    @classmethod
+    def drop_duplicate_inputs(cls, v: List[BatchInput]) -> List[BatchInput]:
+        # overlapping batches can list the same object twice; fetch it once, first occurrence wins
+        seen = set()
+        unique = []
+        for i in v:
+            key = (i.uri, i.doc_id)
+            if key not in seen:
+                seen.add(key)
+                unique.append(i)
+        return unique
+
+class PreflightKey(BaseModel):
+    """The manifest fields input probes depend on; outputs and metrics are left out."""
+    lane: str
+    language: str
+    uris: List[str]
+
+    @classmethod
+    def from_manifest(cls, man: BatchManifest) -> "PreflightKey":
+        # the same object may back several documents; probe it once
+        uris = list(dict.fromkeys(i.uri for i in man.inputs))
+        return cls(lane=man.lane, language=man.language, uris=uris)
@@ -1,10 +1,20 @@
+import hashlib
+from datetime import timedelta
+from typing import Dict
 from prefect import flow, task
-from mumbl_orchestration.batch_types import BatchManifest
+from mumbl_orchestration.batch_types import BatchManifest, PreflightKey
+from mumbl_orchestration.lanes import run_lane
 
-@task
-def preflight(man: BatchManifest) -> BatchManifest:
-    man.metrics["hours_estimated"] = 0.5  # TODO real probe
-    return man
+# re-probe inputs at least daily in case objects were replaced under the same URI
+PREFLIGHT_CACHE_EXPIRATION = timedelta(days=1)
+
+def preflight_cache_key(context, parameters) -> str:
+    key = parameters["key"]
+    return hashlib.blake2b(repr((key.lane, key.language, tuple(key.uris))).encode("utf-8"), digest_size=16).hexdigest()
+
+@task(cache_key_fn=preflight_cache_key, cache_expiration=PREFLIGHT_CACHE_EXPIRATION, persist_result=True)
+def preflight(key: PreflightKey) -> Dict[str, float]:
+    return {"hours_estimated": 0.5}  # TODO real probe
 
 @task
 def asr_diar_align_normalize(man: BatchManifest) -> BatchManifest:
@@ -21,9 +31,7 @@ def validate_audio_outputs(man: BatchManifest) -> BatchManifest:
 
 @flow(name="audio-lane")
 def audio_lane_flow(manifest: dict) -> dict:
-    man = BatchManifest(**manifest)
-    man = preflight.submit(man).result()
-    man = asr_diar_align_normalize.submit(man).result()
-    man = validate_audio_outputs.submit(man).result()
-    man.status = "succeeded"
-    return man.dict()
+    man = BatchManifest.model_validate(manifest)
+    # probes are cached on the inputs, so repeat batches over the same URIs skip them
+    man.metrics.update(preflight(PreflightKey.from_manifest(man)))
+    return run_lane(man, [asr_diar_align_normalize, validate_audio_outputs])
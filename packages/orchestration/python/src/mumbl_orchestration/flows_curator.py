@@ -1,5 +1,6 @@
 from prefect import flow, task
 from mumbl_orchestration.batch_types import BatchManifest
+from mumbl_orchestration.lanes import run_lane
 
 @task
 def score_and_dedupe(man: BatchManifest) -> BatchManifest:
@@ -15,8 +16,4 @@ def snapshot_and_register(man: BatchManifest) -> BatchManifest:
 
 @flow(name="curator")
 def curator_flow(manifest: dict) -> dict:
-    man = BatchManifest(**manifest)
-    man = score_and_dedupe.submit(man).result()
-    man = snapshot_and_register.submit(man).result()
-    man.status = "succeeded"
-    return man.dict()
+    return run_lane(BatchManifest.model_validate(manifest), [score_and_dedupe, snapshot_and_register])
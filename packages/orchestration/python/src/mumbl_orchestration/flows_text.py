@@ -1,5 +1,6 @@
 from prefect import flow, task
 from mumbl_orchestration.batch_types import BatchManifest
+from mumbl_orchestration.lanes import run_lane
 
 @task
 def chunk_and_label(man: BatchManifest) -> BatchManifest:
@@ -16,8 +17,4 @@ def validate_outputs(man: BatchManifest) -> BatchManifest:
 
 @flow(name="text-lane")
 def text_lane_flow(manifest: dict) -> dict:
-    man = BatchManifest(**manifest)
-    man = chunk_and_label.submit(man).result()
-    man = validate_outputs.submit(man).result()
-    man.status = "succeeded"
-    return man.dict()
+    return run_lane(BatchManifest.model_validate(manifest), [chunk_and_label, validate_outputs])
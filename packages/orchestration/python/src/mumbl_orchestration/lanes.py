@@ -0,0 +1,16 @@
+from typing import Sequence
+from prefect import Task
+from mumbl_orchestration.batch_types import BatchManifest
+
+def run_lane(man: BatchManifest, tasks: Sequence[Task]) -> dict:
+    """Run a lane's tasks in order, each fed the previous one's manifest.
+
+    Every task is submitted up front with the upstream future as its input,
+    so Prefect resolves the chain itself; the flow only waits on the last.
+    """
+    fut = man
+    for t in tasks:
+        fut = t.submit(fut)
+    man = fut.result()
+    man.status = "succeeded"
+    return man.model_dump(mode="json")
@@ -6,6 +6,11 @@ import json
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the data contracts to the path
 import sys
 sys.path.insert(0, 'packages/data-contracts/python/src')
@@ -14,6 +19,24 @@ from mumbl_data_contracts.profiles import LanguageProfileV1, G2PRule, G2POverrid
 from mumbl_data_contracts.segments import TextSegment, AudioSegment, SourceRef, Labels  
 from mumbl_data_contracts.scores import SegmentScore
 
+def _dump_json(obj) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _rewrite_refs(node):
+    """Point every #/$defs/ reference in a schema at #/definitions/, in place."""
+    if isinstance(node, dict):
+        ref = node.get('$ref')
+        if isinstance(ref, str) and ref.startswith('#/$defs/'):
+            node['$ref'] = '#/definitions/' + ref[len('#/$defs/'):]
+        for value in node.values():
+            _rewrite_refs(value)
+    elif isinstance(node, list):
+        for item in node:
+            _rewrite_refs(item)
+
 def generate_schema_file(model_class, output_dir: Path):
     """Generate JSON schema for a Pydantic model."""
     schema = model_class.model_json_schema()
@@ -25,13 +48,11 @@ def generate_schema_file(model_class, output_dir: Path):
         schema['definitions'] = defs
         
         # Replace $ref paths from #/$defs/ to #/definitions/
-        schema_str = json.dumps(schema)
-        schema_str = schema_str.replace('"#/$defs/', '"#/definitions/')
-        schema = json.loads(schema_str)
+        _rewrite_refs(schema)
     
     output_file = output_dir / f"{model_class.__name__}.json"
-    with open(output_file, 'w') as f:
-        json.dump(schema, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(_dump_json(schema))
     
     print(f"Generated schema: {output_file}")
     return output_file
@@ -80,8 +101,8 @@ def main():
     }
     
     index_file = output_dir / "index.json"
-    with open(index_file, 'w') as f:
-        json.dump(index_content, f, indent=2)
+    with open(index_file, 'wb') as f:
+        f.write(_dump_json(index_content))
     
     print(f"\nGenerated index file: {index_file}")
 
@@ -2,39 +2,39 @@
 """
 Generate TypeScript types from JSON Schema files.
 """
-import json
 import subprocess
 import sys
 from pathlib import Path
 
-def run_command(command, cwd=None):
-    """Run a shell command and return the result."""
-    result = subprocess.run(command, shell=True, capture_output=True, text=True, cwd=cwd)
-    if result.returncode != 0:
-        print(f"Error running command: {command}")
-        print(f"Error: {result.stderr}")
-        return False
-    return True
+# Node driver that compiles every schema in one process, instead of one npx start per schema
+TYPESCRIPT_DIR = Path("packages/data-contracts/typescript")
+GENERATOR = "generate-types.mjs"
 
-def generate_typescript_from_schema(schema_file: Path, output_dir: Path):
-    """Generate TypeScript types from a JSON schema file."""
-    schema_name = schema_file.stem
-    output_file = output_dir / f"{schema_name}.ts"
-    
+def generate_typescript_from_schemas(schema_files, output_dir: Path):
+    """Generate TypeScript types for all JSON schema files with a single Node process.
+
+    Returns the generated file for each schema, or None where generation failed.
+    """
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Use json-schema-to-typescript via npx with absolute paths
-    abs_schema = schema_file.absolute()
-    abs_output = output_file.absolute()
-    command = f"npx json-schema-to-typescript {abs_schema} > {abs_output}"
+    command = ["node", GENERATOR, str(output_dir.absolute())] + [str(f.absolute()) for f in schema_files]
+    result = subprocess.run(command, capture_output=True, text=True, cwd=TYPESCRIPT_DIR)
+    if result.returncode != 0:
+        print(f"Error running command: {' '.join(command)}")
+        print(f"Error: {result.stderr}")
     
-    if run_command(command, cwd="packages/data-contracts/typescript"):
-        print(f"Generated TypeScript types: {output_file}")
-        return output_file
-    else:
-        print(f"Failed to generate types for {schema_file}")
-        return None
+    generated = set(result.stdout.split())
+    output_files = []
+    for schema_file in schema_files:
+        if schema_file.stem in generated:
+            output_file = output_dir / f"{schema_file.stem}.ts"
+            print(f"Generated TypeScript types: {output_file}")
+            output_files.append(output_file)
+        else:
+            print(f"Failed to generate types for {schema_file}")
+            output_files.append(None)
+    return output_files
 
 def create_index_file(generated_files, output_dir: Path):
     """Create an index.ts file that exports main interfaces only."""
@@ -94,10 +94,7 @@ def main():
     
     print(f"Found {len(schema_files)} schema files")
     
-    generated_files = []
-    for schema_file in schema_files:
-        result = generate_typescript_from_schema(schema_file, output_dir)
-        generated_files.append(result)
+    generated_files = generate_typescript_from_schemas(schema_files, output_dir)
     
     # Create index file
     create_index_file(generated_files, output_dir)
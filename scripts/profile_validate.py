@@ -5,36 +5,41 @@ Profile Validation CLI
 A command-line tool to validate LanguageProfile JSON files using Pydantic models.
 """
 import argparse
+import io
 import json
+import os
 import sys
+from contextlib import redirect_stdout
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import List, Optional, Tuple
 
-# Add the data contracts to the path
+# Add the data contracts to the path; pydantic and the models are imported
+# where they are used, so --help and argument errors return quickly
 sys.path.insert(0, 'packages/data-contracts/python/src')
 
-from mumbl_data_contracts.profiles import LanguageProfileV1
-from pydantic import ValidationError
+# Validating a profile takes tens of microseconds, so smaller batches stay in-process
+PARALLEL_MIN_FILES = 256
 
-def load_json_file(file_path: Path) -> Dict[str, Any]:
-    """Load and parse a JSON file."""
+def load_json_file(file_path: Path) -> bytes:
+    """Read a JSON file's raw bytes; parsing is left to the model."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return f.read()
     except FileNotFoundError:
         print(f"❌ Error: File '{file_path}' not found")
         sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"❌ Error: Invalid JSON in '{file_path}': {e}")
-        sys.exit(1)
     except Exception as e:
         print(f"❌ Error reading file '{file_path}': {e}")
         sys.exit(1)
 
-def validate_profile(data: Dict[str, Any], file_path: Path) -> bool:
-    """Validate a profile data against LanguageProfileV1 model."""
+def validate_profile(raw: bytes, file_path: Path) -> bool:
+    """Parse and validate raw profile JSON against the LanguageProfileV1 model in one pass."""
+    from mumbl_data_contracts.profiles import LanguageProfileV1
+    from pydantic import ValidationError
+
     try:
-        profile = LanguageProfileV1(**data)
+        profile = LanguageProfileV1.model_validate_json(raw)
         print(f"✅ Valid: '{file_path}' passed validation")
         print(f"   Language: {profile.language} ({profile.dialect})")
         print(f"   Version: {profile.version}")
@@ -50,14 +55,31 @@ def validate_profile(data: Dict[str, Any], file_path: Path) -> bool:
         print("   Validation errors:")
         for error in e.errors():
             location = " -> ".join(str(loc) for loc in error['loc'])
-            print(f"     • {location}: {error['msg']}")
-            if 'input' in error:
+            print(f"     • {location}: {error['msg']}" if location else f"     • {error['msg']}")
+            # a JSON syntax error's input is the whole file
+            if 'input' in error and error['type'] != 'json_invalid':
                 print(f"       Input value: {error['input']}")
         return False
     except Exception as e:
         print(f"❌ Error validating '{file_path}': {e}")
         return False
 
+def _validate_one(file_path: Path, verbose: bool = False) -> Tuple[Optional[bool], str]:
+    """Validate one profile file, capturing its report instead of printing it.
+
+    Returns (passed, report); passed is None when the file could not be loaded.
+    """
+    report = io.StringIO()
+    with redirect_stdout(report):
+        if verbose:
+            print(f"Validating {file_path}...")
+        try:
+            raw = load_json_file(file_path)
+        except SystemExit:
+            return None, report.getvalue()
+        passed = validate_profile(raw, file_path)
+    return passed, report.getvalue()
+
 def validate_files(file_paths: List[Path], verbose: bool = False) -> int:
     """Validate multiple profile files and return exit code."""
     total_files = len(file_paths)
@@ -65,13 +87,22 @@ def validate_files(file_paths: List[Path], verbose: bool = False) -> int:
     
     print(f"Validating {total_files} profile file(s)...\n")
     
-    for file_path in file_paths:
-        if verbose:
-            print(f"Validating {file_path}...")
-        
-        data = load_json_file(file_path)
-        
-        if validate_profile(data, file_path):
+    check = partial(_validate_one, verbose=verbose)
+    if total_files >= PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(check, file_paths, chunksize=max(1, total_files // (4 * workers))))
+    else:
+        results = map(check, file_paths)
+    
+    # Reports are printed in file order, whichever worker produced them
+    for passed, report in results:
+        print(report, end="")
+        if passed is None:
+            sys.exit(1)
+        if passed:
             valid_files += 1
         
         if verbose or len(file_paths) > 1:
@@ -90,6 +121,8 @@ def validate_files(file_paths: List[Path], verbose: bool = False) -> int:
 
 def create_example_profile(output_path: Path) -> None:
     """Create an example LanguageProfile JSON file."""
+    from mumbl_data_contracts.profiles import LanguageProfileV1
+
     example_profile = LanguageProfileV1(
         language="English",
         dialect="US", 
@@ -20,16 +20,59 @@ def print_header(message):
     print(f"{BOLD}{YELLOW}{'=' * 80}{RESET}\n")
 
 
+# Read-only lint checks, run concurrently: (command, description, failure message)
+LINT_CHECKS = [
+    (
+        "isort --check-only --diff .",
+        "Checking import sorting with isort",
+        "isort check failed. Run 'isort .' to fix import sorting.",
+    ),
+    (
+        "black --check .",
+        "Checking code formatting with black",
+        "black check failed. Run 'black .' to fix code formatting.",
+    ),
+    (
+        "flake8",
+        "Checking code style with flake8",
+        "flake8 check failed. Please fix the style issues.",
+    ),
+]
+
+
+def print_result(description, stdout, stderr):
+    """Print a command's header and captured output."""
+    print_header(description)
+    print(stdout)
+    if stderr:
+        print(f"{RED}{stderr}{RESET}")
+
+
 def run_command(command, description):
     """Run a command and print its output."""
-    print_header(description)
     result = subprocess.run(command, shell=True, capture_output=True, text=True)
-    print(result.stdout)
-    if result.stderr:
-        print(f"{RED}{result.stderr}{RESET}")
+    print_result(description, result.stdout, result.stderr)
     return result.returncode
 
 
+def run_lint_checks():
+    """Run the lint checks in parallel, reporting them in order; returns True if any failed."""
+    procs = []
+    for command, description, message in LINT_CHECKS:
+        proc = subprocess.Popen(
+            command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        procs.append((description, message, proc))
+    failed = False
+    for description, message, proc in procs:
+        stdout, stderr = proc.communicate()
+        print_result(description, stdout, stderr)
+        if proc.returncode != 0:
+            failed = True
+            print(f"{RED}{message}{RESET}")
+    return failed
+
+
 def main():
     """Run all code quality checks and tests."""
     # Change to the project root directory
@@ -39,20 +82,9 @@ def main():
     # Track if any checks fail
     failed = False
 
-    # Run isort check
-    if run_command("isort --check-only --diff .", "Checking import sorting with isort") != 0:
-        failed = True
-        print(f"{RED}isort check failed. Run 'isort .' to fix import sorting.{RESET}")
-
-    # Run black check
-    if run_command("black --check .", "Checking code formatting with black") != 0:
-        failed = True
-        print(f"{RED}black check failed. Run 'black .' to fix code formatting.{RESET}")
-
-    # Run flake8
-    if run_command("flake8", "Checking code style with flake8") != 0:
+    # Run isort, black and flake8 together; they only read the tree
+    if run_lint_checks():
         failed = True
-        print(f"{RED}flake8 check failed. Please fix the style issues.{RESET}")
 
     # Run unit tests
     if run_command("pytest tests/unit -v", "Running unit tests") != 0:
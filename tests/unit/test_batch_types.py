@@ -0,0 +1,22 @@
+from mumbl_orchestration.batch_types import BatchManifest, PreflightKey
+
+def _manifest(inputs):
+    return BatchManifest(batch_id="b1", lane="text", language="en", dialect="us", inputs=inputs)
+
+def test_manifest_drops_duplicate_inputs():
+    man = _manifest([
+        {"uri": "s3://bucket/a.txt", "doc_id": "A"},
+        {"uri": "s3://bucket/b.txt"},
+        {"uri": "s3://bucket/a.txt", "doc_id": "A"},
+        {"uri": "s3://bucket/b.txt"},
+    ])
+    assert [(i.uri, i.doc_id) for i in man.inputs] == [("s3://bucket/a.txt", "A"), ("s3://bucket/b.txt", None)]
+
+def test_manifest_keeps_documents_sharing_a_uri():
+    man = _manifest([
+        {"uri": "s3://bucket/a.txt", "doc_id": "A"},
+        {"uri": "s3://bucket/a.txt", "doc_id": "B"},
+    ])
+    assert [i.doc_id for i in man.inputs] == ["A", "B"]
+    # the shared object is still probed once
+    assert PreflightKey.from_manifest(man).uris == ["s3://bucket/a.txt"]
@@ -1,3 +1,6 @@
+import csv
+import io
+from mumbl_dataset_builder.build_tts import build_metadata_csv
 from mumbl_dataset_builder.lints import lint_tts_manifest
 
 def test_lints_ok():
@@ -7,3 +10,39 @@ def test_lints_ok():
     ]
     rep = lint_tts_manifest(rows)
     assert rep.ok
+
+def test_lints_report_stats():
+    rows = [
+        {"wav":"clips/a.wav","sample_rate":24000,"duration_s":2.0,"text":"hi"},
+        {"wav":"clips/b.wav","sample_rate":24000,"duration_s":3.5,"phonemes":"ðɛɹ"}
+    ]
+    rep = lint_tts_manifest(rows)
+    assert rep.ok
+    assert rep.sample_rates == {24000}
+    assert rep.total_duration_s == 5.5
+
+def test_lints_sample_rate_mix_reported_first():
+    rows = [
+        {"wav":"clips/a.wav","sample_rate":24000,"duration_s":2.0},
+        {"wav":"clips/b.wav","sample_rate":22050,"duration_s":20.0,"text":"there"}
+    ]
+    rep = lint_tts_manifest(rows)
+    assert not rep.ok
+    assert [i.code for i in rep.issues] == ["SAMPLE_RATE_MIX", "NO_TEXT_OR_PHONEMES", "DURATION"]
+    assert rep.sample_rates == {24000, 22050}
+
+def test_metadata_csv_matches_csv_writer(tmp_path):
+    rows = [
+        {"wav":"clips/a.wav","text":'say "hi"',"phonemes":"a|b","speaker_id":"spk_1"},
+        {"wav":"clips/b.wav","text":"two\nlines","phonemes":None},
+        {"wav":"clips/c.wav","text":"pipe | inside","phonemes":"plain","speaker_id":"spk\r2"},
+        {"wav":"clips/d.wav"},
+    ]
+    for use_phonemes in (False, True):
+        path = build_metadata_csv(str(tmp_path / str(use_phonemes)), rows, use_phonemes=use_phonemes)
+        expected = io.StringIO(newline="")
+        w = csv.writer(expected, delimiter="|")
+        for r in rows:
+            w.writerow([r["wav"], r.get("phonemes") if use_phonemes else r.get("text", ""), r.get("speaker_id", "spk_unknown")])
+        with open(path, newline="", encoding="utf-8") as f:
+            assert f.read() == expected.getvalue()
@@ -7,7 +7,7 @@ from unittest.mock import patch
 
 import pytest
 
-from scraper.format_output import format_json_file, format_word_data
+from scraper.format_output import format_json_file, format_word_data, load_json_file, output_stem
 
 
 class TestFormatOutput:
@@ -109,3 +109,35 @@ class TestFormatOutput:
 
             # Verify format_word_data was called with the right data
             mock_format_word_data.assert_called_once_with(sample_word_data)
+
+    def test_load_json_file_zstd(self, sample_word_data):
+        """Test that zstd-compressed scraper output loads like plain JSON."""
+        zstandard = pytest.importorskip("zstandard")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plain_path = os.path.join(temp_dir, "test_data.json")
+            with open(plain_path, "w", encoding="utf-8") as f:
+                json.dump([sample_word_data], f, ensure_ascii=False)
+
+            compressed_path = os.path.join(temp_dir, "test_data.json.zst")
+            with open(compressed_path, "wb") as f:
+                f.write(zstandard.ZstdCompressor().compress(json.dumps([sample_word_data]).encode("utf-8")))
+
+            assert load_json_file(compressed_path) == load_json_file(plain_path) == [sample_word_data]
+            assert output_stem(compressed_path) == output_stem(plain_path) == "test_data"
+
+    @patch("scraper.format_output.format_word_data")
+    def test_format_json_file_skips_error_items(self, mock_format_word_data, sample_word_data):
+        """Test that pages the scraper marked as errors are left out of the markdown."""
+        mock_format_word_data.return_value = "Formatted word data"
+        error_item = {"word": "missing", "language": "en", "url": "https://en.wiktionary.org/wiki/missing",
+                      "error": "empty/error"}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_json_path = os.path.join(temp_dir, "test_data.json")
+            with open(temp_json_path, "w") as f:
+                json.dump([error_item, sample_word_data], f)
+
+            format_json_file(temp_json_path, os.path.join(temp_dir, "test_output.md"))
+
+            mock_format_word_data.assert_called_once_with(sample_word_data)
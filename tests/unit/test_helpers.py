@@ -0,0 +1,48 @@
+"""Unit tests for the utils/helpers.py module using mocks to avoid database access."""
+
+from unittest.mock import patch
+
+from utils import helpers
+from utils.helpers import get_language_name, words_exist
+
+
+class TestHelpers:
+    """Unit tests for the database helpers."""
+
+    @patch("utils.helpers.execute_query")
+    def test_words_exist_single_query(self, mock_execute_query):
+        """Test that many words are checked with one query and duplicates collapse."""
+        mock_execute_query.return_value = [
+            {"word_text": "cat", "language_code": "en"},
+            {"word_text": "chat", "language_code": "fr"},
+        ]
+
+        found = words_exist([("cat", "en"), ("chat", "fr"), ("dog", "en"), ("cat", "en")])
+
+        assert found == {("cat", "en"), ("chat", "fr")}
+        mock_execute_query.assert_called_once()
+        words, language_codes = mock_execute_query.call_args[0][1]
+        assert sorted(zip(words, language_codes)) == [("cat", "en"), ("chat", "fr"), ("dog", "en")]
+
+    @patch("utils.helpers.execute_query")
+    def test_words_exist_empty_and_failed(self, mock_execute_query):
+        """Test that no query runs for no words and a failed query finds nothing."""
+        assert words_exist([]) == set()
+        mock_execute_query.assert_not_called()
+
+        mock_execute_query.return_value = None
+        assert words_exist([("cat", "en")]) == set()
+
+    @patch("utils.helpers.execute_query")
+    def test_language_name_lookup_does_not_cache_failures(self, mock_execute_query):
+        """Test that database lookups are cached, but failed queries are retried."""
+        helpers._lookup_language_name.cache_clear()
+        mock_execute_query.side_effect = [None, [{"language_name": "Klingon"}], []]
+
+        assert get_language_name("tlh") is None  # query failed
+        assert get_language_name("tlh") == "Klingon"
+        assert get_language_name("tlh") == "Klingon"  # cached
+        assert get_language_name("xx-unknown") is None
+        assert get_language_name("xx-unknown") is None  # "not found" is cached
+        assert mock_execute_query.call_count == 3
+        helpers._lookup_language_name.cache_clear()
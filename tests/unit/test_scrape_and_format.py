@@ -0,0 +1,38 @@
+"""Unit tests for the scrape_and_format.py module with the scraper stubbed out."""
+
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from scraper.scrape_and_format import scrape_and_format
+
+
+class TestScrapeAndFormat:
+    """Unit tests for the combined scrape-and-format run."""
+
+    def test_status_and_formatted_output_reach_stdout(self, capsys):
+        """Test that status lines and --print output go to stdout after scraping in-process."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "wiktionary_en_20250310_123456.json")
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump([{"word": "test", "language": "en", "definitions": ["A procedure."],
+                            "url": "https://en.wiktionary.org/wiki/test"}], f)
+
+            with patch("scraper.scrape_and_format.run_scrape", return_value=output_file) as mock_run_scrape:
+                code = scrape_and_format(single_word="test", output=temp_dir, print_output=True)
+
+            assert code == 0
+            mock_run_scrape.assert_called_once()
+            out = capsys.readouterr().out
+            assert f"Scraper completed successfully. Output saved to: {output_file}" in out
+            assert f"Formatting output file: {output_file}" in out
+            assert "Formatting completed. Formatted output saved to:" in out
+            assert "**Word:** test" in out
+            assert "1. A procedure." in out
+
+    def test_missing_output_is_reported(self, capsys):
+        """Test that a scrape without an output file fails without formatting."""
+        with patch("scraper.scrape_and_format.run_scrape", return_value=None):
+            assert scrape_and_format(single_word="test") == 1
+        assert "Scraper did not produce an output file" in capsys.readouterr().err
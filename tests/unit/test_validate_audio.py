@@ -0,0 +1,106 @@
+import struct
+import wave
+
+import pytest
+
+from mumbl_format_guardians.validate_audio import (
+    KSDATAFORMAT_SUBTYPE_PCM, WAVE_FORMAT_EXTENSIBLE, _wav_meta, validate_audio_dataset,
+)
+
+KSDATAFORMAT_SUBTYPE_IEEE_FLOAT = b'\x03' + KSDATAFORMAT_SUBTYPE_PCM[1:]
+
+
+def _write_wave(path, sr=24000, ch=1, sampwidth=2, nframes=48000):
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(ch)
+        w.setsampwidth(sampwidth)
+        w.setframerate(sr)
+        w.writeframes(b'\x00' * (nframes * ch * sampwidth))
+    return str(path)
+
+
+def _chunk(chunk_id, payload):
+    return struct.pack('<4sI', chunk_id, len(payload)) + payload + b'\x00' * (len(payload) & 1)
+
+
+def _write_riff(path, *chunks):
+    body = b'WAVE' + b''.join(chunks)
+    path.write_bytes(b'RIFF' + struct.pack('<I', len(body)) + body)
+    return str(path)
+
+
+def _fmt(tag=1, ch=1, sr=24000, bits=16, subformat=None):
+    block = ch * bits // 8
+    payload = struct.pack('<HHIIHH', tag, ch, sr, sr * block, block, bits)
+    if subformat is not None:
+        payload += struct.pack('<HHI16s', 22, bits, 0x4, subformat)
+    return _chunk(b'fmt ', payload)
+
+
+@pytest.mark.parametrize("sr,ch,sampwidth", [(24000, 1, 2), (22050, 1, 1), (22050, 2, 2)])
+def test_wav_meta_matches_wave(tmp_path, sr, ch, sampwidth):
+    path = _write_wave(tmp_path / "a.wav", sr=sr, ch=ch, sampwidth=sampwidth, nframes=sr * 2)
+    with wave.open(path, 'rb') as w:
+        expected = (w.getframerate(), w.getnchannels(), w.getnframes() / float(w.getframerate()), w.getsampwidth())
+    assert _wav_meta(path) == expected
+
+
+def test_wav_meta_skips_list_and_odd_sized_chunks(tmp_path):
+    path = _write_riff(
+        tmp_path / "a.wav",
+        _chunk(b'LIST', b'INFOISFT\x05\x00\x00\x00lavf\x00'),
+        _fmt(),
+        _chunk(b'junk', b'abc'),  # odd size, padded to even
+        _chunk(b'data', b'\x00' * 48000),
+    )
+    assert _wav_meta(path) == (24000, 1, 1.0, 2)
+
+
+def test_wav_meta_accepts_extensible_pcm(tmp_path):
+    path = _write_riff(
+        tmp_path / "a.wav",
+        _fmt(tag=WAVE_FORMAT_EXTENSIBLE, subformat=KSDATAFORMAT_SUBTYPE_PCM),
+        _chunk(b'data', b'\x00' * 96000),
+    )
+    assert _wav_meta(path) == (24000, 1, 2.0, 2)
+
+
+def test_wav_meta_rejects_extensible_float(tmp_path):
+    path = _write_riff(
+        tmp_path / "a.wav",
+        _fmt(tag=WAVE_FORMAT_EXTENSIBLE, bits=32, subformat=KSDATAFORMAT_SUBTYPE_IEEE_FLOAT),
+        _chunk(b'data', b'\x00' * 96000),
+    )
+    with pytest.raises(ValueError):
+        _wav_meta(path)
+
+
+def test_wav_meta_rejects_plain_float(tmp_path):
+    path = _write_riff(tmp_path / "a.wav", _fmt(tag=3, bits=32), _chunk(b'data', b'\x00' * 96000))
+    with pytest.raises(ValueError):
+        _wav_meta(path)
+
+
+@pytest.mark.parametrize("size", [4, 20, 40])
+def test_wav_meta_rejects_truncated(tmp_path, size):
+    full = _write_riff(tmp_path / "full.wav", _chunk(b'LIST', b'x' * 10), _fmt(), _chunk(b'junk', b'y' * 4))
+    path = tmp_path / "cut.wav"
+    path.write_bytes(open(full, 'rb').read()[:size])
+    with pytest.raises(Exception):
+        _wav_meta(str(path))
+
+
+def test_validate_audio_dataset_reports_in_csv_order(tmp_path):
+    clips = tmp_path / "clips"
+    clips.mkdir()
+    _write_wave(clips / "ok.wav")
+    _write_wave(clips / "stereo.wav", ch=2)
+    _write_wave(clips / "short.wav", nframes=100)
+    csv_path = tmp_path / "metadata.csv"
+    csv_path.write_text("audio_file\nclips/ok.wav\nclips/stereo.wav\nclips/missing.wav\nclips/short.wav\n")
+    rep = validate_audio_dataset(str(clips), str(csv_path), workers=1)
+    assert not rep.ok
+    assert rep.checked == 3
+    assert [(e.code, e.path) for e in rep.errors] == [
+        ("CHANNELS", "line 3"), ("MISSING_WAV", "line 4"), ("DURATION", "line 5"),
+    ]
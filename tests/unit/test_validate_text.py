@@ -5,3 +5,23 @@ def test_validate_text_ok():
     rep = validate_text_jsonl(data.splitlines())
     assert rep.ok
     assert rep.checked == 1
+
+def test_validate_text_bytes_and_blank_lines():
+    data = b'{"text":"Hi","lang":"en","labels":{"is_dialogue":true,"topic":"g","register":"i","code_switch_spans":[]},"source_ref":{"doc_id":"SRC","start":0,"end":2}}\n'
+    rep = validate_text_jsonl([data, b"\n", b"   ", "", data.decode()])
+    assert rep.ok
+    assert rep.checked == 2
+
+def test_validate_text_json_decode_error():
+    rep = validate_text_jsonl(['{"text": "Hi",', b'not json'])
+    assert not rep.ok
+    assert rep.checked == 0
+    assert [(e.code, e.path) for e in rep.errors] == [("JSON_DECODE", "[1]"), ("JSON_DECODE", "[2]")]
+
+def test_validate_text_contract_and_grounding_errors():
+    bad_contract = b'{"text":"Hi","lang":"en"}'
+    bad_offsets = b'{"text":"Hi","lang":"en","labels":{"is_dialogue":true,"topic":"g","register":"i","code_switch_spans":[]},"source_ref":{"doc_id":"SRC","start":2,"end":2}}'
+    rep = validate_text_jsonl([bad_contract, bad_offsets])
+    assert not rep.ok
+    assert rep.checked == 2
+    assert [(e.code, e.path) for e in rep.errors] == [("CONTRACT", "[1]"), ("GROUNDING_OFFSETS", "[2].source_ref")]
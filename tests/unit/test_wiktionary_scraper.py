@@ -2,12 +2,16 @@
 
 import argparse
 import os
+import sys
 import tempfile
 from unittest.mock import MagicMock, patch
 
 import pytest
+import scrapy
+from scrapy.http import HtmlResponse
 
-from scraper.wiktionary_scraper import run_spider
+from scraper.scraper_config import iter_wordlist
+from scraper.wiktionary_scraper import PerDomainRateLimitMiddleware, WiktionarySpider, run_spider
 
 
 class TestWiktionaryScraper:
@@ -120,3 +124,77 @@ class TestWiktionaryScraper:
         args = parser.parse_args(["--language", "en", "--single-word", "test", "--limit", "5"])
         assert args.language == "en"
         assert args.limit == 5
+
+    @patch("twisted.internet.task.deferLater")
+    @patch("scraper.wiktionary_scraper.time.monotonic")
+    def test_rate_limit_token_bucket(self, mock_monotonic, mock_defer_later):
+        """Test that each domain gets a burst, then is paced to the configured rate."""
+        mock_monotonic.return_value = 100.0
+        middleware = PerDomainRateLimitMiddleware(rate=10, burst=2)
+        request = scrapy.Request("https://en.wiktionary.org/wiki/test")
+        other = scrapy.Request("https://fr.wiktionary.org/wiki/test")
+
+        # The burst goes through without delay
+        assert middleware.process_request(request, None) is None
+        assert middleware.process_request(request, None) is None
+
+        # The next request waits for its token: 1 / rate seconds
+        middleware.process_request(request, None)
+        assert mock_defer_later.call_args[0][1] == pytest.approx(0.1)
+
+        # Other domains have their own bucket
+        assert middleware.process_request(other, None) is None
+
+        # Tokens refill over time, up to the burst size
+        mock_monotonic.return_value = 200.0
+        assert middleware.process_request(request, None) is None
+        assert middleware.process_request(request, None) is None
+        assert mock_defer_later.call_count == 1
+
+    def test_error_pages_are_marked_and_not_recorded_in_manifest(self):
+        """Test that short-circuited pages carry an error marker and skip the manifest."""
+        spider = WiktionarySpider(words=["test"], manifest_path="unused_manifest.json")
+        url = "https://en.wiktionary.org/wiki/test"
+        meta = {"word": "test", "validator": '"etag-1"'}
+
+        with patch("scraper.wiktionary_scraper.log_failed_page"):
+            error_page = HtmlResponse(url, status=404, body=b"gone", request=scrapy.Request(url, meta=meta))
+            item = spider.parse(error_page)
+        assert item["error"] == "empty/error"
+        assert spider.manifest == {}
+
+        body = b"<html><body><ol><li>A procedure.</li></ol>" + b" " * 1024 + b"</body></html>"
+        page = HtmlResponse(url, status=200, body=body, request=scrapy.Request(url, meta=meta))
+        item = spider.parse(page)
+        assert "error" not in item
+        assert item["definitions"] == ["A procedure."]
+        assert spider.manifest == {url: '"etag-1"'}
+
+    def test_iter_wordlist(self):
+        """Test that word lists are streamed with blank lines and whitespace stripped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            word_list_path = os.path.join(temp_dir, "words.txt")
+            with open(word_list_path, "wb") as f:
+                f.write("test\r\n\n  cat \ncafé\nlast".encode("utf-8"))
+            assert list(iter_wordlist(word_list_path)) == ["test", "cat", "café", "last"]
+
+            empty_path = os.path.join(temp_dir, "empty.txt")
+            open(empty_path, "w").close()
+            assert list(iter_wordlist(empty_path)) == []
+
+    @patch("scraper.wiktionary_scraper.CrawlerProcess")
+    def test_run_spider_restores_stdio(self, mock_crawler_process):
+        """Test that run_spider undoes the LOG_STDOUT redirection for in-process callers."""
+        stdout, stderr = sys.stdout, sys.stderr
+
+        def hijack_streams(*args, **kwargs):
+            # Scrapy's LOG_STDOUT replaces sys.stdout when the process is created
+            sys.stdout = sys.stderr = MagicMock()
+            return MagicMock()
+
+        mock_crawler_process.side_effect = hijack_streams
+        with tempfile.TemporaryDirectory() as temp_dir:
+            run_spider(language="en", words=["test"], output_dir=temp_dir)
+
+        assert sys.stdout is stdout
+        assert sys.stderr is stderr